@@ -3,10 +3,15 @@
 
 from __future__ import annotations
 
-import os
-import subprocess
 import sys
+from pathlib import Path
 
+# Add parent to path for shared modules
+_PARENT = Path(__file__).resolve().parent.parent
+if str(_PARENT) not in sys.path:
+    sys.path.insert(0, str(_PARENT))
+
+from fetch_extension import fetch
 from helper import get_context
 
 
@@ -14,16 +19,7 @@ def main(argv: list[str] | None = None) -> None:
     """Download the GitHub Copilot Chat VSIX into the cache."""
     _ = argv or sys.argv[1:]
     context = get_context()
-    env = os.environ.copy()
-    env.setdefault("PYTHON_GIL", "0")
-    env["EXTENSION_ID"] = context.extension_id
-    env["EXTENSION_CACHE"] = str(context.cache_dir)
-    subprocess.run(
-        [sys.executable, str(context.fetcher)],
-        check=True,
-        env=env,
-        cwd=context.extension_dir,
-    )
+    sys.exit(fetch(context.extension_id, context.cache_dir))
 
 
 if __name__ == "__main__":
@@ -5,12 +5,14 @@ from __future__ import annotations
 
 import importlib.util
 import sys
+from functools import cache
 from pathlib import Path
 from types import ModuleType
 
 EXTENSION_ID = "GitHub.copilot"
 
 
+@cache
 def _load_helper() -> ModuleType:
     helper_path = Path(__file__).resolve().parents[2] / "helper.py"
     spec = importlib.util.spec_from_file_location("github_copilot_helper", helper_path)
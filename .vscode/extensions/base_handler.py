@@ -18,7 +18,7 @@ _PARENT = Path(__file__).resolve().parent
 if str(_PARENT) not in sys.path:
     sys.path.insert(0, str(_PARENT))
 
-from fetch_extension import TensorDownloader, GPUHasher, _HAS_AIOHTTP
+from fetch_extension import TensorDownloader, GPUHasher, _HAS_AIOHTTP, fetch
 
 if TYPE_CHECKING:
     from dataclasses import dataclass
@@ -120,18 +120,8 @@ class BaseHandler:
             exit_code = asyncio.run(self.download_async())
             sys.exit(exit_code)
         else:
-            # Legacy subprocess fallback
-            import subprocess
-            env = os.environ.copy()
-            env["EXTENSION_ID"] = self._extension_id
-            env["EXTENSION_CACHE"] = str(self._cache_dir)
-            fetcher = self._extension_dir.parent / "fetch_extension.py"
-            subprocess.run(
-                [sys.executable, str(fetcher)],
-                check=True,
-                env=env,
-                cwd=self._extension_dir,
-            )
+            # Legacy in-process fallback (urllib)
+            sys.exit(fetch(self._extension_id, self._cache_dir))
 
 
 def create_handler(
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import cache
 from enum import IntEnum, auto
 from pathlib import Path
 from typing import TYPE_CHECKING, Final
@@ -131,6 +132,21 @@ class ExtensionRegistry:
         self._size += 1
         return idx
 
+    def register_many(self, contexts: list[ExtensionContext]) -> list[int]:
+        """Register extensions in order and return their indices.
+
+        Callers keep the returned indices alongside their results and pass
+        them to update_state()/update_states() instead of looking up
+        extension IDs again.
+
+        Args:
+            contexts: Extension contexts to register.
+
+        Returns:
+            Indices in the same order as contexts.
+        """
+        return [self.register(context) for context in contexts]
+
     def _grow(self) -> None:
         """Double capacity with aligned reallocation."""
         new_capacity = self._capacity * 2
@@ -155,6 +171,20 @@ class ExtensionRegistry:
         if ctx is not None:
             self._contexts[idx] = ctx.with_state(state)
 
+    def update_states(self, indices: list[int], state: ExtensionState) -> None:
+        """Update many extensions to one state with a single array write.
+
+        Args:
+            indices: Extension indices from register()/register_many().
+            state: New state value.
+        """
+        self._states[indices] = state.value
+        contexts = self._contexts
+        for idx in indices:
+            ctx = contexts[idx]
+            if ctx is not None:
+                contexts[idx] = ctx.with_state(state)
+
     def get_by_state(self, state: ExtensionState) -> NDArray[np.intp]:
         """Vectorized query for extensions in given state.
 
@@ -191,9 +221,13 @@ class ExtensionRegistry:
         return ctx
 
 
+@cache
 def create_context(extension_id: str, base_dir: Path | None = None) -> ExtensionContext:
     """Factory function for creating extension contexts.
 
+    Memoized per (extension_id, base_dir); contexts are immutable, so the
+    cached instance is shared safely.
+
     Args:
         extension_id: VS Code marketplace extension ID.
         base_dir: Override base directory (defaults to /opt/extensions).
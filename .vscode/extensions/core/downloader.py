@@ -7,16 +7,14 @@ import asyncio
 import json
 import mmap
 import os
+import time
+from collections import deque
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, AsyncIterator, Final
 
-import numpy as np
-
 if TYPE_CHECKING:
-    from numpy.typing import NDArray
-
     from .context import ExtensionContext
 
 # Try GPU-accelerated HTTP client, fall back to aiohttp
@@ -27,11 +25,24 @@ try:
 except ImportError:
     _HAS_AIOHTTP = False
 
+# orjson parses bytes directly and is several times faster on large payloads
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Buffer sizes aligned to GPU tensor cores and page boundaries
 CHUNK_SIZE: Final[int] = 1024 * 1024  # 1MB chunks for streaming
 BUFFER_POOL_SIZE: Final[int] = 8  # Pre-allocated buffer count
 PAGE_SIZE: Final[int] = 4096  # OS page size for mmap alignment
 TENSOR_ALIGNMENT: Final[int] = 128  # GPU tensor core alignment
+RANGE_THRESHOLD: Final[int] = 16 * 1024 * 1024  # Split larger downloads into ranges
+RANGE_PART_SIZE: Final[int] = 8 * 1024 * 1024  # Target bytes per range request
+MAX_RANGE_PARTS: Final[int] = 4  # Parallel range connections per file
+PARTIAL_SUFFIX: Final[str] = ".part"  # In-progress downloads, renamed on success
+PARTIAL_MAX_AGE_S: Final[int] = 24 * 60 * 60  # Stale partial downloads are removed
 
 API_URL: Final[str] = "https://marketplace.visualstudio.com/_apis/public/gallery/extensionquery"
 API_VERSION: Final[str] = "3.0-preview.1"
@@ -59,11 +70,12 @@ class DownloadStats:
 class BufferPool:
     """Pre-allocated buffer pool for zero-copy I/O.
 
-    Uses numpy arrays for SIMD-friendly memory layout.
-    Thread-safe buffer acquisition with atomic operations.
+    Buffers are plain bytearrays, which every socket and file API accepts.
+    Free buffers are tracked in a deque; acquire/release never await,
+    so they are atomic on the event loop without a lock.
     """
 
-    __slots__ = ("_buffers", "_available", "_lock")
+    __slots__ = ("_buffers", "_free")
 
     def __init__(self, count: int = BUFFER_POOL_SIZE, size: int = CHUNK_SIZE) -> None:
         """Initialize buffer pool with aligned allocations.
@@ -76,37 +88,34 @@ class BufferPool:
         aligned_size = ((size + PAGE_SIZE - 1) // PAGE_SIZE) * PAGE_SIZE
 
         # Pre-allocate contiguous memory block
-        self._buffers: list[NDArray[np.uint8]] = [
-            np.empty(aligned_size, dtype=np.uint8) for _ in range(count)
-        ]
-        self._available: list[int] = list(range(count))
-        self._lock = asyncio.Lock()
+        self._buffers: list[bytearray] = [bytearray(aligned_size) for _ in range(count)]
+        self._free: deque[int] = deque(range(count))
 
-    async def acquire(self) -> tuple[int, NDArray[np.uint8]]:
+    async def acquire(self) -> tuple[int, bytearray]:
         """Acquire a buffer from the pool.
 
         Returns:
-            Tuple of (buffer_id, buffer_array).
+            Tuple of (buffer_id, buffer).
 
         Raises:
             RuntimeError: If no buffers available.
         """
-        async with self._lock:
-            if not self._available:
-                msg = "Buffer pool exhausted"
-                raise RuntimeError(msg)
-            idx = self._available.pop()
-            return idx, self._buffers[idx]
+        if not self._free:
+            msg = "Buffer pool exhausted"
+            raise RuntimeError(msg)
+        idx = self._free.popleft()
+        return idx, self._buffers[idx]
 
     async def release(self, idx: int) -> None:
         """Release buffer back to pool.
 
+        Each acquired index must be released exactly once; double release
+        is a caller bug and is not checked.
+
         Args:
             idx: Buffer ID from acquire().
         """
-        async with self._lock:
-            if idx not in self._available:
-                self._available.append(idx)
+        self._free.append(idx)
 
 
 class TensorDownloader:
@@ -147,6 +156,8 @@ class TensorDownloader:
             connector = aiohttp.TCPConnector(
                 limit=100,
                 limit_per_host=10,
+                ttl_dns_cache=600,
+                keepalive_timeout=75,
                 enable_cleanup_closed=True,
                 force_close=False,
             )
@@ -200,7 +211,7 @@ class TensorDownloader:
 
         async with session.post(API_URL, json=payload, headers=headers) as response:
             response.raise_for_status()
-            data = await response.json()
+            data = _json_loads(await response.read())
 
         extensions = data.get("results", [{}])[0].get("extensions", [])
         if not extensions:
@@ -215,6 +226,62 @@ class TensorDownloader:
         msg = f"VSIX URL not found for {extension_id}"
         raise RuntimeError(msg)
 
+    async def _probe(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+    ) -> tuple[int, bool]:
+        """Issue a HEAD request for a download URL.
+
+        Args:
+            session: Active HTTP session.
+            url: Download URL.
+
+        Returns:
+            Tuple of (content_length, accepts_ranges); (0, False) if unknown.
+        """
+        async with session.head(url, allow_redirects=True) as response:
+            if response.status != 200:
+                return 0, False
+            accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+            return response.content_length or 0, accepts_ranges
+
+    @staticmethod
+    def _is_current(target: Path, remote_size: int) -> bool:
+        """Check whether target already holds a VSIX of remote_size bytes.
+
+        Marketplace VSIX URLs are versioned, so a local file whose size
+        matches the remote Content-Length is treated as up to date.
+
+        Args:
+            target: Target file path.
+            remote_size: Content-Length reported by the server.
+
+        Returns:
+            True if the cached file can be reused.
+        """
+        try:
+            local_size = target.stat().st_size
+        except FileNotFoundError:
+            return False
+        return local_size > 0 and local_size == remote_size
+
+    @staticmethod
+    def _preallocate(fd: int, size: int) -> None:
+        """Reserve disk blocks for a file of known size.
+
+        posix_fallocate allocates contiguous blocks up front; truncate only
+        sets the inode size and is used where fallocate is unavailable.
+        """
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, size)
+                return
+            except OSError:
+                # Unsupported on some filesystems (e.g. tmpfs on older kernels)
+                pass
+        os.ftruncate(fd, size)
+
     async def _stream_to_mmap(
         self,
         session: aiohttp.ClientSession,
@@ -242,7 +309,7 @@ class TensorDownloader:
             # Pre-allocate file if size known
             if content_length > 0:
                 with target.open("wb") as f:
-                    f.truncate(content_length)
+                    self._preallocate(f.fileno(), content_length)
 
             # Stream chunks with zero-copy writes
             with target.open("r+b" if content_length > 0 else "wb") as f:
@@ -265,6 +332,156 @@ class TensorDownloader:
 
         return total_bytes, chunk_count
 
+    async def _fetch_range(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        mm: mmap.mmap,
+        lo: int,
+        hi: int,
+    ) -> tuple[int, int] | None:
+        """Stream an inclusive byte range into the matching mmap slice.
+
+        Args:
+            session: Active HTTP session.
+            url: Download URL.
+            mm: Memory map covering the whole target file.
+            lo: First byte offset.
+            hi: Last byte offset (inclusive).
+
+        Returns:
+            Tuple of (total_bytes, chunk_count), or None if the server
+            ignored the Range header.
+        """
+        headers = {"Range": f"bytes={lo}-{hi}"}
+        async with session.get(url, headers=headers) as response:
+            if response.status != 206:
+                return None
+
+            offset = lo
+            chunk_count = 0
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                chunk_len = len(chunk)
+                mm[offset : offset + chunk_len] = chunk
+                offset += chunk_len
+                chunk_count += 1
+
+        return offset - lo, chunk_count
+
+    async def _stream_ranges_to_mmap(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        target: Path,
+        size: int,
+    ) -> tuple[int, int] | None:
+        """Download as parallel byte ranges into one memory-mapped file.
+
+        Each part writes a disjoint slice of the mapping, so no locking is
+        needed between tasks.
+
+        Args:
+            session: Active HTTP session.
+            url: Download URL.
+            target: Target file path.
+            size: Total content length in bytes.
+
+        Returns:
+            Tuple of (total_bytes, chunk_count), or None if ranges are unsupported.
+
+        Raises:
+            RuntimeError: If the ranges did not cover the whole file.
+        """
+        target.parent.mkdir(parents=True, exist_ok=True)
+        parts = min(MAX_RANGE_PARTS, -(-size // RANGE_PART_SIZE))
+        part_size = -(-size // parts)
+
+        with target.open("wb") as f:
+            self._preallocate(f.fileno(), size)
+
+        with target.open("r+b") as f:
+            with mmap.mmap(f.fileno(), size) as mm:
+                # A TaskGroup cancels the sibling parts when one fails, so none
+                # is still writing when the mapping closes
+                try:
+                    async with asyncio.TaskGroup() as tg:
+                        tasks = [
+                            tg.create_task(
+                                self._fetch_range(
+                                    session, url, mm, lo, min(lo + part_size, size) - 1
+                                )
+                            )
+                            for lo in range(0, size, part_size)
+                        ]
+                except ExceptionGroup as eg:
+                    raise eg.exceptions[0] from None
+
+        results = [task.result() for task in tasks]
+        if any(result is None for result in results):
+            return None
+
+        total_bytes = sum(result[0] for result in results if result is not None)
+        chunk_count = sum(result[1] for result in results if result is not None)
+        if total_bytes != size:
+            msg = f"Incomplete ranged download: {total_bytes}/{size} bytes"
+            raise RuntimeError(msg)
+        return total_bytes, chunk_count
+
+    @staticmethod
+    def _remove_stale_partials(directory: Path) -> None:
+        """Delete partial downloads left behind by killed processes.
+
+        Args:
+            directory: Cache directory to sweep.
+        """
+        cutoff = time.time() - PARTIAL_MAX_AGE_S
+        for partial in directory.glob(f"*{PARTIAL_SUFFIX}"):
+            try:
+                if partial.stat().st_mtime < cutoff:
+                    partial.unlink()
+            except FileNotFoundError:
+                continue
+
+    async def _fetch_atomic(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        target: Path,
+        size: int,
+        accepts_ranges: bool,
+    ) -> tuple[int, int]:
+        """Download into a partial file next to target, then rename it.
+
+        A crash mid-download leaves only the partial file behind, so a
+        truncated VSIX is never mistaken for a cached one.
+
+        Args:
+            session: Active HTTP session.
+            url: Download URL.
+            target: Final file path.
+            size: Content length from the HEAD probe (0 if unknown).
+            accepts_ranges: Whether the server honours byte ranges.
+
+        Returns:
+            Tuple of (total_bytes, chunk_count).
+        """
+        target.parent.mkdir(parents=True, exist_ok=True)
+        self._remove_stale_partials(target.parent)
+        partial = target.with_name(target.name + PARTIAL_SUFFIX)
+
+        try:
+            result: tuple[int, int] | None = None
+            if accepts_ranges and size >= RANGE_THRESHOLD:
+                result = await self._stream_ranges_to_mmap(session, url, partial, size)
+            if result is None:
+                result = await self._stream_to_mmap(session, url, partial)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+
+        os.replace(partial, target)
+        return result
+
     async def download(self, context: ExtensionContext) -> DownloadStats:
         """Download extension VSIX with tensor-optimized I/O.
 
@@ -275,17 +492,24 @@ class TensorDownloader:
             Download statistics for telemetry.
         """
         async with self._semaphore:
-            start_ns = int(asyncio.get_event_loop().time() * 1_000_000_000)
+            start_ns = time.perf_counter_ns()
 
             async with self._get_session() as session:
                 url = await self._query_marketplace(session, context.extension_id)
-                total_bytes, chunk_count = await self._stream_to_mmap(
-                    session,
-                    url,
-                    context.vsix_file,
-                )
+                remote_size, accepts_ranges = await self._probe(session, url)
 
-            elapsed_ns = int(asyncio.get_event_loop().time() * 1_000_000_000) - start_ns
+                if self._is_current(context.vsix_file, remote_size):
+                    total_bytes, chunk_count = 0, 0
+                else:
+                    total_bytes, chunk_count = await self._fetch_atomic(
+                        session,
+                        url,
+                        context.vsix_file,
+                        remote_size,
+                        accepts_ranges,
+                    )
+
+            elapsed_ns = time.perf_counter_ns() - start_ns
 
             # Compute checksum (placeholder - see hasher.py for GPU version)
             checksum = b"\x00" * 32
@@ -313,6 +537,27 @@ class TensorDownloader:
         tasks = [self.download(ctx) for ctx in contexts]
         return await asyncio.gather(*tasks, return_exceptions=False)
 
+    async def download_batch_iter(
+        self,
+        contexts: list[ExtensionContext],
+    ) -> AsyncIterator[tuple[ExtensionContext, DownloadStats]]:
+        """Download multiple extensions, yielding each as it completes.
+
+        Args:
+            contexts: List of extension contexts.
+
+        Yields:
+            ``(context, stats)`` tuples in completion order.
+        """
+
+        async def _one(
+            ctx: ExtensionContext,
+        ) -> tuple[ExtensionContext, DownloadStats]:
+            return ctx, await self.download(ctx)
+
+        for next_done in asyncio.as_completed([_one(ctx) for ctx in contexts]):
+            yield await next_done
+
     async def close(self) -> None:
         """Clean up resources."""
         if self._session and not self._session.closed:
@@ -26,11 +26,17 @@ except ImportError:
     _xp = np
 
 # Hash computation constants
-HASH_BLOCK_SIZE: Final[int] = 1024 * 1024  # 1MB blocks for streaming
+HASH_BLOCK_SIZE: Final[int] = 4 * 1024 * 1024  # 4MB blocks, sized to L2
 SHA256_DIGEST_SIZE: Final[int] = 32
 TENSOR_ALIGNMENT: Final[int] = 128
 
 
+def _advise_sequential(mm: mmap.mmap) -> None:
+    """Hint the kernel to read ahead and drop pages behind a linear scan."""
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+
+
 @dataclass(frozen=True, slots=True)
 class HashResult:
     """Immutable hash result with metadata."""
@@ -99,16 +105,18 @@ class GPUHasher:
                 gpu_accelerated=False,
             )
 
-        hasher = hashlib.sha256()
+        hasher = hashlib.new("sha256", usedforsecurity=False)
         blocks = 0
 
         with path.open("rb") as f:
             with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
-                # Process in aligned blocks
-                for offset in range(0, file_size, self._block_size):
-                    end = min(offset + self._block_size, file_size)
-                    hasher.update(mm[offset:end])
-                    blocks += 1
+                _advise_sequential(mm)
+                # Process in aligned blocks, zero-copy from the page cache
+                with memoryview(mm) as view:
+                    for offset in range(0, file_size, self._block_size):
+                        with view[offset : offset + self._block_size] as chunk:
+                            hasher.update(chunk)
+                        blocks += 1
 
         return HashResult(
             digest=hasher.digest(),
@@ -143,26 +151,26 @@ class GPUHasher:
                 gpu_accelerated=True,
             )
 
-        hasher = hashlib.sha256()
+        hasher = hashlib.new("sha256", usedforsecurity=False)
         blocks = 0
 
         with path.open("rb") as f:
             with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
-                for offset in range(0, file_size, self._block_size):
-                    end = min(offset + self._block_size, file_size)
-                    chunk = mm[offset:end]
-
-                    # Transfer to GPU for preprocessing
-                    gpu_chunk = cp.frombuffer(chunk, dtype=cp.uint8)
-
-                    # GPU-accelerated byte statistics for integrity
-                    # (actual SHA-256 still on CPU as GPU crypto is limited)
-                    _ = cp.sum(gpu_chunk)  # Force GPU sync
-                    cp.cuda.Stream.null.synchronize()
-
-                    # Final hash on CPU
-                    hasher.update(chunk)
-                    blocks += 1
+                _advise_sequential(mm)
+                with memoryview(mm) as view:
+                    for offset in range(0, file_size, self._block_size):
+                        with view[offset : offset + self._block_size] as chunk:
+                            # Transfer to GPU for preprocessing
+                            gpu_chunk = cp.frombuffer(chunk, dtype=cp.uint8)
+
+                            # GPU-accelerated byte statistics for integrity
+                            # (actual SHA-256 still on CPU as GPU crypto is limited)
+                            _ = cp.sum(gpu_chunk)  # Force GPU sync
+                            cp.cuda.Stream.null.synchronize()
+
+                            # Final hash on CPU
+                            hasher.update(chunk)
+                        blocks += 1
 
         return HashResult(
             digest=hasher.digest(),
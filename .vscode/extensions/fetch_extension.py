@@ -4,7 +4,6 @@
 High-performance implementation with:
 - Async I/O with aiohttp for concurrent streaming downloads
 - Memory-mapped file writes for zero-copy I/O
-- NumPy-backed state tracking for SIMD-friendly vectorized operations
 - GPU-accelerated SHA-256 hashing via CuPy (with CPU fallback)
 - Pre-allocated buffer pools for GC-free operation
 - Priority-based task scheduling with lock-free queues
@@ -13,25 +12,21 @@ High-performance implementation with:
 from __future__ import annotations
 
 import asyncio
+import atexit
 import hashlib
 import json
 import mmap
 import os
 import sys
+import time
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import IntEnum, auto
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Final, NoReturn
+from typing import AsyncIterator, Final, NoReturn
 
 # Try GPU acceleration imports
-try:
-    import numpy as np
-
-    _HAS_NUMPY = True
-except ImportError:
-    _HAS_NUMPY = False
-
 try:
     import aiohttp
 
@@ -46,8 +41,18 @@ try:
 except ImportError:
     _HAS_CUPY = False
 
-if TYPE_CHECKING:
-    from numpy.typing import NDArray
+# orjson parses bytes directly and is several times faster on large payloads
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Free-threaded builds (PEP 703) run hashing threads truly in parallel
+_FREE_THREADED: Final[bool] = (
+    hasattr(sys, "_is_gil_enabled") and not sys._is_gil_enabled()
+)
 
 # =============================================================================
 # Constants aligned to hardware boundaries
@@ -55,9 +60,15 @@ if TYPE_CHECKING:
 API_URL: Final[str] = "https://marketplace.visualstudio.com/_apis/public/gallery/extensionquery"
 API_VERSION: Final[str] = "3.0-preview.1"
 CHUNK_SIZE: Final[int] = 1024 * 1024  # 1MB for optimal streaming
+HASH_BLOCK_SIZE: Final[int] = 4 * 1024 * 1024  # 4MB, sized to L2 for SHA-NI
 PAGE_SIZE: Final[int] = 4096  # OS page size for mmap alignment
 CACHE_LINE_SIZE: Final[int] = 64  # CPU cache line for SIMD
 TENSOR_ALIGNMENT: Final[int] = 128  # GPU tensor core alignment
+RANGE_THRESHOLD: Final[int] = 16 * 1024 * 1024  # Split larger downloads into ranges
+RANGE_PART_SIZE: Final[int] = 8 * 1024 * 1024  # Target bytes per range request
+MAX_RANGE_PARTS: Final[int] = 4  # Parallel range connections per file
+PARTIAL_SUFFIX: Final[str] = ".part"  # In-progress downloads, renamed on success
+PARTIAL_MAX_AGE_S: Final[int] = 24 * 60 * 60  # Stale partial downloads are removed
 
 
 # =============================================================================
@@ -99,57 +110,58 @@ class DownloadStats:
 class BufferPool:
     """Pre-allocated buffer pool for GC-free streaming operations.
 
-    Uses NumPy arrays for SIMD-friendly memory layout.
-    Thread-safe buffer acquisition with asyncio locks.
+    Buffers are plain bytearrays, which every socket and file API accepts.
+    Free buffers are tracked in a deque; acquire/release never await,
+    so they are atomic on the event loop without a lock.
     """
 
-    __slots__ = ("_buffers", "_available", "_lock", "_size")
+    __slots__ = ("_buffers", "_free", "_size")
 
     def __init__(self, count: int = 8, size: int = CHUNK_SIZE) -> None:
         """Initialize buffer pool with aligned allocations."""
         aligned_size = ((size + PAGE_SIZE - 1) // PAGE_SIZE) * PAGE_SIZE
         self._size = aligned_size
 
-        if _HAS_NUMPY:
-            self._buffers: list[Any] = [
-                np.empty(aligned_size, dtype=np.uint8) for _ in range(count)
-            ]
-        else:
-            self._buffers = [bytearray(aligned_size) for _ in range(count)]
+        self._buffers: list[bytearray] = [bytearray(aligned_size) for _ in range(count)]
 
-        self._available: list[int] = list(range(count))
-        self._lock = asyncio.Lock()
+        self._free: deque[int] = deque(range(count))
 
-    async def acquire(self) -> tuple[int, Any]:
+    async def acquire(self) -> tuple[int, bytearray]:
         """Acquire a buffer from the pool."""
-        async with self._lock:
-            if not self._available:
-                # Dynamically allocate if exhausted
-                idx = len(self._buffers)
-                if _HAS_NUMPY:
-                    self._buffers.append(np.empty(self._size, dtype=np.uint8))
-                else:
-                    self._buffers.append(bytearray(self._size))
-                return idx, self._buffers[idx]
-            idx = self._available.pop()
+        if not self._free:
+            # Dynamically allocate if exhausted
+            idx = len(self._buffers)
+            self._buffers.append(bytearray(self._size))
             return idx, self._buffers[idx]
+        idx = self._free.popleft()
+        return idx, self._buffers[idx]
 
     async def release(self, idx: int) -> None:
-        """Release buffer back to pool."""
-        async with self._lock:
-            if idx not in self._available:
-                self._available.append(idx)
+        """Release buffer back to pool.
+
+        Each acquired index must be released exactly once; double release
+        is a caller bug and is not checked.
+        """
+        self._free.append(idx)
 
 
 # =============================================================================
 # GPU-Accelerated Hasher
 # =============================================================================
+def _advise_sequential(mm: mmap.mmap) -> None:
+    """Hint the kernel to read ahead and drop pages behind a linear scan."""
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+
+
 class GPUHasher:
     """SHA-256 hasher with GPU preprocessing via CuPy."""
 
     __slots__ = ("_use_gpu", "_block_size")
 
-    def __init__(self, use_gpu: bool = True, block_size: int = CHUNK_SIZE) -> None:
+    def __init__(
+        self, use_gpu: bool = True, block_size: int = HASH_BLOCK_SIZE
+    ) -> None:
         """Initialize hasher with compute preferences."""
         self._use_gpu = use_gpu and _HAS_CUPY
         self._block_size = block_size
@@ -169,25 +181,79 @@ class GPUHasher:
         if file_size == 0:
             return hashlib.sha256(b"").digest(), 0
 
-        hasher = hashlib.sha256()
+        # usedforsecurity=False lets OpenSSL pick its fastest (SHA-NI) path
+        hasher = hashlib.new("sha256", usedforsecurity=False)
         blocks = 0
 
         with path.open("rb") as f:
             with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
-                for offset in range(0, file_size, self._block_size):
-                    end = min(offset + self._block_size, file_size)
-                    chunk = mm[offset:end]
+                _advise_sequential(mm)
+                # memoryview slices hash straight from the page cache
+                with memoryview(mm) as view:
+                    for offset in range(0, file_size, self._block_size):
+                        with view[offset : offset + self._block_size] as chunk:
+                            if self._use_gpu:
+                                # Transfer to GPU for parallel byte preprocessing
+                                gpu_chunk = cp.frombuffer(chunk, dtype=cp.uint8)
+                                # Force sync (actual SHA still on CPU)
+                                cp.cuda.Stream.null.synchronize()
+
+                            hasher.update(chunk)
+                        blocks += 1
 
-                    if self._use_gpu:
-                        # Transfer to GPU for parallel byte preprocessing
-                        gpu_chunk = cp.frombuffer(chunk, dtype=cp.uint8)
-                        # Force sync (actual SHA still on CPU)
-                        cp.cuda.Stream.null.synchronize()
+        return hasher.digest(), blocks
 
-                    hasher.update(chunk)
-                    blocks += 1
+    async def hash_files_batch(
+        self, paths: list[Path], max_concurrent: int | None = None
+    ) -> list[tuple[bytes, int] | Exception]:
+        """Hash many files concurrently on the shared hashing pool.
 
-        return hasher.digest(), blocks
+        SHA-256 is sequential within a file, so files are the unit of
+        parallelism; results are returned in input order. A file that cannot
+        be hashed yields its exception in place of a result, so one unreadable
+        file does not abort the rest.
+
+        Args:
+            paths: Files to hash.
+            max_concurrent: Cap on in-flight hashes (default: unbounded).
+
+        Returns:
+            List of (digest, blocks_processed) tuples or per-file exceptions.
+        """
+        loop = asyncio.get_running_loop()
+        pool = _hash_pool()
+        limit = asyncio.Semaphore(max_concurrent or max(len(paths), 1))
+
+        async def _hash(path: Path) -> tuple[bytes, int] | Exception:
+            async with limit:
+                try:
+                    return await loop.run_in_executor(pool, self.hash_file, path)
+                except Exception as e:
+                    return e
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_hash(path)) for path in paths]
+        return [task.result() for task in tasks]
+
+
+_HASH_POOL: ThreadPoolExecutor | None = None
+
+
+def _hash_pool() -> ThreadPoolExecutor:
+    """Return the process-wide hashing pool, creating it on first use.
+
+    hashlib releases the GIL on large updates, so threads hash in parallel;
+    on a free-threaded build the pool scales to every core.
+    """
+    global _HASH_POOL
+    if _HASH_POOL is None:
+        cpus = os.cpu_count() or 4
+        _HASH_POOL = ThreadPoolExecutor(
+            max_workers=cpus if _FREE_THREADED else min(8, cpus),
+            thread_name_prefix="vsix-hash",
+        )
+        atexit.register(_HASH_POOL.shutdown)
+    return _HASH_POOL
 
 
 # =============================================================================
@@ -205,12 +271,17 @@ class TensorDownloader:
 
     __slots__ = ("_pool", "_session", "_semaphore", "_hasher")
 
-    def __init__(self, max_concurrent: int = 4) -> None:
+    def __init__(self, max_concurrent: int = 4, use_gpu: bool = True) -> None:
         """Initialize downloader with resource limits."""
         self._pool = BufferPool()
         self._session: aiohttp.ClientSession | None = None
         self._semaphore = asyncio.Semaphore(max_concurrent)
-        self._hasher = GPUHasher(use_gpu=_HAS_CUPY)
+        self._hasher = GPUHasher(use_gpu=use_gpu and _HAS_CUPY)
+
+    @property
+    def gpu_hashing(self) -> bool:
+        """Check if downloads are hashed on the GPU."""
+        return self._hasher.is_gpu_enabled
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session with connection pooling."""
@@ -222,7 +293,10 @@ class TensorDownloader:
             connector = aiohttp.TCPConnector(
                 limit=100,
                 limit_per_host=10,
+                ttl_dns_cache=600,
+                keepalive_timeout=75,
                 enable_cleanup_closed=True,
+                force_close=False,
             )
             timeout = aiohttp.ClientTimeout(total=300, connect=30)
             self._session = aiohttp.ClientSession(
@@ -249,7 +323,7 @@ class TensorDownloader:
         session = await self._get_session()
         async with session.post(API_URL, json=payload, headers=headers) as response:
             response.raise_for_status()
-            data = await response.json()
+            data = _json_loads(await response.read())
 
         extensions = data.get("results", [{}])[0].get("extensions", [])
         if not extensions:
@@ -264,6 +338,48 @@ class TensorDownloader:
         msg = f"VSIX URL not found for {extension_id}"
         raise RuntimeError(msg)
 
+    async def _probe(self, url: str) -> tuple[int, bool]:
+        """Issue a HEAD request for url.
+
+        Returns:
+            Tuple of (content_length, accepts_ranges); (0, False) if unknown.
+        """
+        session = await self._get_session()
+        async with session.head(url, allow_redirects=True) as response:
+            if response.status != 200:
+                return 0, False
+            accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+            return response.content_length or 0, accepts_ranges
+
+    @staticmethod
+    def _is_current(target: Path, remote_size: int) -> bool:
+        """Check whether target already holds a VSIX of remote_size bytes.
+
+        Marketplace VSIX URLs are versioned, so a local file whose size
+        matches the remote Content-Length is treated as up to date.
+        """
+        try:
+            local_size = target.stat().st_size
+        except FileNotFoundError:
+            return False
+        return local_size > 0 and local_size == remote_size
+
+    @staticmethod
+    def _preallocate(fd: int, size: int) -> None:
+        """Reserve disk blocks for a file of known size.
+
+        posix_fallocate allocates contiguous blocks up front; truncate only
+        sets the inode size and is used where fallocate is unavailable.
+        """
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, size)
+                return
+            except OSError:
+                # Unsupported on some filesystems (e.g. tmpfs on older kernels)
+                pass
+        os.ftruncate(fd, size)
+
     async def _stream_to_mmap(self, url: str, target: Path) -> tuple[int, int]:
         """Stream download directly to memory-mapped file.
 
@@ -282,7 +398,7 @@ class TensorDownloader:
             # Pre-allocate file if size known
             if content_length > 0:
                 with target.open("wb") as f:
-                    f.truncate(content_length)
+                    self._preallocate(f.fileno(), content_length)
 
                 # Memory-map for zero-copy writes
                 with target.open("r+b") as f:
@@ -304,35 +420,182 @@ class TensorDownloader:
 
         return total_bytes, chunk_count
 
+    async def _fetch_range(self, url: str, mm: mmap.mmap, lo: int, hi: int) -> tuple[int, int] | None:
+        """Stream bytes lo..hi (inclusive) of url into the matching mmap slice.
+
+        Returns:
+            Tuple of (total_bytes, chunk_count), or None if the server
+            ignored the Range header.
+        """
+        session = await self._get_session()
+        headers = {"Range": f"bytes={lo}-{hi}"}
+        async with session.get(url, headers=headers) as response:
+            if response.status != 206:
+                return None
+
+            offset = lo
+            chunk_count = 0
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                chunk_len = len(chunk)
+                mm[offset : offset + chunk_len] = chunk
+                offset += chunk_len
+                chunk_count += 1
+
+        return offset - lo, chunk_count
+
+    async def _stream_ranges_to_mmap(
+        self, url: str, target: Path, size: int
+    ) -> tuple[int, int] | None:
+        """Download url as parallel byte ranges into one memory-mapped file.
+
+        Each part writes a disjoint slice of the mapping, so no locking is
+        needed between tasks.
+
+        Returns:
+            Tuple of (total_bytes, chunk_count), or None if ranges are unsupported.
+        """
+        target.parent.mkdir(parents=True, exist_ok=True)
+        parts = min(MAX_RANGE_PARTS, -(-size // RANGE_PART_SIZE))
+        part_size = -(-size // parts)
+
+        with target.open("wb") as f:
+            self._preallocate(f.fileno(), size)
+
+        with target.open("r+b") as f:
+            with mmap.mmap(f.fileno(), size) as mm:
+                # A TaskGroup cancels the sibling parts when one fails, so none
+                # is still writing when the mapping closes
+                try:
+                    async with asyncio.TaskGroup() as tg:
+                        tasks = [
+                            tg.create_task(
+                                self._fetch_range(url, mm, lo, min(lo + part_size, size) - 1)
+                            )
+                            for lo in range(0, size, part_size)
+                        ]
+                except ExceptionGroup as eg:
+                    raise eg.exceptions[0] from None
+
+        results = [task.result() for task in tasks]
+        if any(result is None for result in results):
+            return None
+
+        total_bytes = sum(result[0] for result in results if result is not None)
+        chunk_count = sum(result[1] for result in results if result is not None)
+        if total_bytes != size:
+            msg = f"Incomplete ranged download: {total_bytes}/{size} bytes"
+            raise RuntimeError(msg)
+        return total_bytes, chunk_count
+
+    @staticmethod
+    def _remove_stale_partials(directory: Path) -> None:
+        """Delete partial downloads left behind by killed processes."""
+        cutoff = time.time() - PARTIAL_MAX_AGE_S
+        for partial in directory.glob(f"*{PARTIAL_SUFFIX}"):
+            try:
+                if partial.stat().st_mtime < cutoff:
+                    partial.unlink()
+            except FileNotFoundError:
+                continue
+
+    async def _fetch_atomic(
+        self, url: str, target: Path, size: int, accepts_ranges: bool
+    ) -> tuple[int, int]:
+        """Download into a partial file next to target, then rename it.
+
+        A crash mid-download leaves only the partial file behind, so a
+        truncated VSIX is never mistaken for a cached one.
+
+        Returns:
+            Tuple of (total_bytes, chunk_count).
+        """
+        target.parent.mkdir(parents=True, exist_ok=True)
+        self._remove_stale_partials(target.parent)
+        partial = target.with_name(target.name + PARTIAL_SUFFIX)
+
+        try:
+            result: tuple[int, int] | None = None
+            if accepts_ranges and size >= RANGE_THRESHOLD:
+                result = await self._stream_ranges_to_mmap(url, partial, size)
+            if result is None:
+                result = await self._stream_to_mmap(url, partial)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+
+        os.replace(partial, target)
+        return result
+
     async def download(
         self,
         extension_id: str,
         cache_dir: Path,
         verify: bool = True,
     ) -> DownloadStats:
-        """Download extension VSIX with tensor-optimized I/O."""
+        """Download extension VSIX with tensor-optimized I/O.
+
+        The concurrency slot is released before hashing so verification of
+        one file overlaps the transfer of the next.
+        """
         async with self._semaphore:
-            start_ns = int(asyncio.get_event_loop().time() * 1_000_000_000)
+            start_ns = time.perf_counter_ns()
 
             url = await self._query_marketplace(extension_id)
             target = cache_dir / f"{extension_id}.vsix"
-            total_bytes, chunk_count = await self._stream_to_mmap(url, target)
-
-            elapsed_ns = int(asyncio.get_event_loop().time() * 1_000_000_000) - start_ns
+            remote_size, accepts_ranges = await self._probe(url)
 
-            # Compute checksum
-            if verify:
-                checksum, _ = self._hasher.hash_file(target)
+            if self._is_current(target, remote_size):
+                total_bytes, chunk_count = 0, 0
             else:
-                checksum = b"\x00" * 32
-
-            return DownloadStats(
-                extension_id=extension_id,
-                bytes_downloaded=total_bytes,
-                chunks_processed=chunk_count,
-                elapsed_ns=elapsed_ns,
-                checksum=checksum,
+                total_bytes, chunk_count = await self._fetch_atomic(
+                    url, target, remote_size, accepts_ranges
+                )
+
+            elapsed_ns = time.perf_counter_ns() - start_ns
+
+        # Compute checksum
+        if verify:
+            loop = asyncio.get_running_loop()
+            checksum, _ = await loop.run_in_executor(
+                _hash_pool(), self._hasher.hash_file, target
             )
+        else:
+            checksum = b"\x00" * 32
+
+        return DownloadStats(
+            extension_id=extension_id,
+            bytes_downloaded=total_bytes,
+            chunks_processed=chunk_count,
+            elapsed_ns=elapsed_ns,
+            checksum=checksum,
+        )
+
+    async def download_batch_iter(
+        self,
+        items: list[tuple[str, Path]],
+        verify: bool = True,
+    ) -> AsyncIterator[tuple[str, DownloadStats | Exception]]:
+        """Download ``(extension_id, cache_dir)`` pairs concurrently.
+
+        Yields ``(extension_id, stats)`` in completion order; a failed
+        download yields its exception in place of the stats so callers can
+        report each result as soon as it lands.
+        """
+
+        async def _one(
+            extension_id: str, cache_dir: Path
+        ) -> tuple[str, DownloadStats | Exception]:
+            try:
+                return extension_id, await self.download(
+                    extension_id, cache_dir, verify=verify
+                )
+            except Exception as e:
+                return extension_id, e
+
+        for next_done in asyncio.as_completed(
+            [_one(extension_id, cache_dir) for extension_id, cache_dir in items]
+        ):
+            yield await next_done
 
     async def close(self) -> None:
         """Clean up resources."""
@@ -367,7 +630,7 @@ def _legacy_download(extension_id: str, destination: str) -> None:
     )
 
     with urllib.request.urlopen(request, timeout=30) as response:  # noqa: S310
-        data = json.loads(response.read().decode("utf-8"))
+        data = _json_loads(response.read())
 
     extensions = data["results"][0]["extensions"]
     if not extensions:
@@ -383,23 +646,21 @@ def _legacy_download(extension_id: str, destination: str) -> None:
 
     os.makedirs(destination, exist_ok=True)
     target = os.path.join(destination, f"{extension_id}.vsix")
-    urllib.request.urlretrieve(url, target)  # noqa: S310
+    partial = target + PARTIAL_SUFFIX
+    urllib.request.urlretrieve(url, partial)  # noqa: S310
+    os.replace(partial, target)
     print(f"Downloaded {extension_id} to {target}")
 
 
 # =============================================================================
 # Entry Points
 # =============================================================================
-async def main_async() -> int:
-    """Async entry point for tensor-optimized download."""
-    extension_id = os.environ.get("EXTENSION_ID")
-    destination = os.environ.get("EXTENSION_CACHE")
-
-    if not extension_id or not destination:
-        print("Error: EXTENSION_ID and EXTENSION_CACHE required", file=sys.stderr)
-        return 1
+async def fetch_one(extension_id: str, cache_dir: Path) -> int:
+    """Download one extension with the tensor-optimized downloader.
 
-    cache_dir = Path(destination)
+    Returns:
+        Exit code (0 for success, 1 for failure).
+    """
     downloader = TensorDownloader(max_concurrent=4)
 
     try:
@@ -412,7 +673,7 @@ async def main_async() -> int:
         print(f"  Throughput: {stats.throughput_mbps:.2f} MB/s")
         print(f"  SHA256: {stats.checksum.hex()}")
         print(f"  Path: {cache_dir / f'{extension_id}.vsix'}")
-        print(f"  GPU Hash: {downloader._hasher.is_gpu_enabled}")
+        print(f"  GPU Hash: {downloader.gpu_hashing}")
 
         return 0
     except Exception as e:
@@ -422,6 +683,37 @@ async def main_async() -> int:
         await downloader.close()
 
 
+def fetch(extension_id: str, cache_dir: Path) -> int:
+    """Download one extension in-process with automatic fallback.
+
+    Lets handlers fetch without spawning a fresh interpreter per extension.
+
+    Returns:
+        Exit code (0 for success, 1 for failure).
+    """
+    if _HAS_AIOHTTP:
+        return asyncio.run(fetch_one(extension_id, cache_dir))
+
+    try:
+        _legacy_download(extension_id, str(cache_dir))
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+async def main_async() -> int:
+    """Async entry point for tensor-optimized download."""
+    extension_id = os.environ.get("EXTENSION_ID")
+    destination = os.environ.get("EXTENSION_CACHE")
+
+    if not extension_id or not destination:
+        print("Error: EXTENSION_ID and EXTENSION_CACHE required", file=sys.stderr)
+        return 1
+
+    return await fetch_one(extension_id, Path(destination))
+
+
 def main() -> None:
     """Main entry point with automatic fallback."""
     extension_id = os.environ.get("EXTENSION_ID")
@@ -12,9 +12,10 @@ import asyncio
 import json
 import os
 import sys
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Final, TypedDict
+from typing import Final, TextIO, TypedDict
 
 # Import from standalone fetch_extension (no core dependency)
 from fetch_extension import (
@@ -23,10 +24,19 @@ from fetch_extension import (
     DownloadStats,
     _HAS_AIOHTTP,
     _HAS_CUPY,
+    _FREE_THREADED,
 )
 
+# orjson serializes straight to UTF-8 bytes and is much faster than stdlib json
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 # Known extensions from docker-compose
-KNOWN_EXTENSIONS: Final[list[str]] = [
+KNOWN_EXTENSIONS: Final[tuple[str, ...]] = (
     "GitHub.copilot",
     "GitHub.copilot-chat",
     "GitHub.vscode-pull-request-github",
@@ -39,7 +49,11 @@ KNOWN_EXTENSIONS: Final[list[str]] = [
     "eamodio.gitlens",
     "streetsidesoftware.code-spell-checker",
     "EditorConfig.EditorConfig",
-]
+)
+_KNOWN_SET: Final[frozenset[str]] = frozenset(KNOWN_EXTENSIONS)
+
+# Reciprocal of one MiB, so report formatting multiplies instead of divides
+_MB_INV: Final[float] = 1.0 / (1024 * 1024)
 
 # GPU-required extensions
 GPU_EXTENSIONS: Final[frozenset[str]] = frozenset({
@@ -82,23 +96,102 @@ class ExtensionInfo:
     vsix_file: Path
     is_gpu_required: bool
 
+    # Lazily populated stat of vsix_file so each row costs one syscall
+    _stat: os.stat_result | None = field(default=None, init=False, repr=False, compare=False)
+    _stat_loaded: bool = field(default=False, init=False, repr=False, compare=False)
+
+    @property
+    def vsix_stat(self) -> os.stat_result | None:
+        """Return the cached stat of the VSIX file, or None if missing."""
+        if not self._stat_loaded:
+            try:
+                result: os.stat_result | None = self.vsix_file.stat()
+            except FileNotFoundError:
+                result = None
+            # Use object.__setattr__ since frozen=True
+            object.__setattr__(self, "_stat", result)
+            object.__setattr__(self, "_stat_loaded", True)
+        return self._stat
+
+    @property
+    def size_bytes(self) -> int:
+        """Get cached VSIX file size, or 0 if not present."""
+        st = self.vsix_stat
+        return st.st_size if st is not None else 0
+
     @property
     def is_cached(self) -> bool:
-        return self.vsix_file.exists() and self.vsix_file.stat().st_size > 0
+        return self.size_bytes > 0
+
+
+# Default cache paths for the known extensions, built once at import so the
+# CLI does no per-run Path arithmetic for them
+_DEFAULT_BASE: Final[Path] = Path(os.environ.get("EXTENSION_BASE_DIR", "/opt/extensions"))
+_KNOWN_PATHS: Final[dict[str, tuple[Path, Path]]] = {
+    ext: (_DEFAULT_BASE / ext, _DEFAULT_BASE / ext / f"{ext}.vsix") for ext in KNOWN_EXTENSIONS
+}
 
 
 def get_extension_info(extension_id: str, base_dir: Path | None = None) -> ExtensionInfo:
     """Create extension info from ID."""
-    base = base_dir or Path(os.environ.get("EXTENSION_BASE_DIR", "/opt/extensions"))
-    cache_dir = base / extension_id
+    if base_dir is None and extension_id in _KNOWN_PATHS:
+        cache_dir, vsix_file = _KNOWN_PATHS[extension_id]
+    else:
+        cache_dir = (base_dir or _DEFAULT_BASE) / extension_id
+        vsix_file = cache_dir / f"{extension_id}.vsix"
     return ExtensionInfo(
         extension_id=extension_id,
         cache_dir=cache_dir,
-        vsix_file=cache_dir / f"{extension_id}.vsix",
+        vsix_file=vsix_file,
         is_gpu_required=extension_id in GPU_EXTENSIONS,
     )
 
 
+def _fmt_mb(n: int) -> str:
+    """Format a byte count as megabytes for report lines."""
+    return f"{n * _MB_INV:.1f}MB"
+
+
+def _flush_lines(lines: list[str], stream: TextIO | None = None) -> None:
+    """Write buffered report lines with a single write call."""
+    if lines:
+        (stream or sys.stdout).write("\n".join(lines) + "\n")
+        lines.clear()
+
+
+def _warn_unknown(extensions: Sequence[str]) -> None:
+    """Warn about extension IDs outside KNOWN_EXTENSIONS before any work starts."""
+    unknown = [ext for ext in extensions if ext not in _KNOWN_SET]
+    if unknown:
+        print(f"Warning: unknown extensions: {', '.join(unknown)}", file=sys.stderr)
+
+
+def _scan_cache(base_dir: Path, extension_ids: Sequence[str]) -> dict[str, int]:
+    """Map requested extension IDs to cached VSIX sizes.
+
+    One scandir pass over ``base_dir`` finds which cache directories exist;
+    each present one then costs a single stat of its VSIX, with no
+    exists() probe and no listing of directories that were not requested.
+    """
+    wanted = set(extension_ids)
+    sizes: dict[str, int] = {}
+    try:
+        entries = os.scandir(base_dir)
+    except FileNotFoundError:
+        return sizes
+
+    with entries:
+        present = [entry.name for entry in entries if entry.name in wanted and entry.is_dir()]
+
+    for ext in present:
+        vsix_path = os.path.join(base_dir, ext, f"{ext}.vsix")
+        try:
+            sizes[ext] = os.stat(vsix_path).st_size
+        except OSError:
+            continue
+    return sizes
+
+
 async def cmd_download(args: argparse.Namespace) -> int:
     """Download extensions command."""
     if not _HAS_AIOHTTP:
@@ -107,46 +200,46 @@ async def cmd_download(args: argparse.Namespace) -> int:
         return 1
 
     extensions = args.extensions or KNOWN_EXTENSIONS
+    _warn_unknown(extensions)
     base_dir = Path(args.cache_dir) if args.cache_dir else None
     infos = [get_extension_info(ext, base_dir) for ext in extensions]
 
-    downloader = TensorDownloader(max_concurrent=args.concurrent)
-    hasher = GPUHasher(use_gpu=args.gpu and _HAS_CUPY)
+    downloader = TensorDownloader(max_concurrent=args.concurrent, use_gpu=args.gpu)
 
     print(f"Downloading {len(extensions)} extensions (concurrent={args.concurrent})...")
-    print(f"GPU hashing: {hasher.is_gpu_enabled}")
+    print(f"GPU hashing: {downloader.gpu_hashing}")
 
     success = 0
     failed = 0
 
     try:
-        for info in infos:
-            try:
-                stats = await downloader.download(
-                    info.extension_id,
-                    info.cache_dir,
-                    verify=args.verify,
-                )
-
+        # Report each extension as soon as its download (and hash) finishes
+        items = [(info.extension_id, info.cache_dir) for info in infos]
+        async for extension_id, result in downloader.download_batch_iter(
+            items, verify=args.verify
+        ):
+            if isinstance(result, Exception):
+                print(f"  ✗ {extension_id}: {result}", file=sys.stderr, flush=True)
+                failed += 1
+            else:
+                stats = result
+                # download() already hashed the file on the shared pool
                 if args.verify:
-                    digest, _ = hasher.hash_file(info.vsix_file)
-                    checksum = digest.hex()[:16]
+                    checksum = stats.checksum.hex()[:16]
                 else:
                     checksum = "skipped"
 
-                size_mb = stats.bytes_downloaded / (1024 * 1024)
-                throughput = stats.throughput_mbps
-                msg = f"  ✓ {info.extension_id}: {size_mb:.1f}MB ({throughput:.1f}MB/s) [{checksum}]"
-                print(msg)
+                if stats.chunks_processed == 0:
+                    msg = f"  ✓ {extension_id}: up to date [{checksum}]"
+                else:
+                    size = _fmt_mb(stats.bytes_downloaded)
+                    throughput = stats.throughput_mbps
+                    msg = f"  ✓ {extension_id}: {size} ({throughput:.1f}MB/s) [{checksum}]"
+                print(msg, flush=True)
                 success += 1
 
-            except Exception as e:
-                print(f"  ✗ {info.extension_id}: {e}", file=sys.stderr)
-                failed += 1
-
         print(f"\nCompleted: {success}/{len(extensions)} (failed: {failed})")
         return 0 if failed == 0 else 1
-
     finally:
         await downloader.close()
 
@@ -154,34 +247,56 @@ async def cmd_download(args: argparse.Namespace) -> int:
 async def cmd_verify(args: argparse.Namespace) -> int:
     """Verify cached extensions command."""
     extensions = args.extensions or KNOWN_EXTENSIONS
+    _warn_unknown(extensions)
     base_dir = Path(args.cache_dir) if args.cache_dir else None
     infos = [get_extension_info(ext, base_dir) for ext in extensions]
 
     hasher = GPUHasher(use_gpu=args.gpu and _HAS_CUPY)
-    print(f"Verifying {len(extensions)} extensions (GPU={hasher.is_gpu_enabled})...")
+    print(
+        f"Verifying {len(extensions)} extensions "
+        f"(GPU={hasher.is_gpu_enabled}, free-threaded={_FREE_THREADED})..."
+    )
+
+    # Concurrent GPU hashers contend for the device, so default to one
+    concurrency = args.verify_concurrency or (1 if hasher.is_gpu_enabled else None)
+    cached = [info for info in infos if info.vsix_stat is not None]
+    hashed = await hasher.hash_files_batch(
+        [info.vsix_file for info in cached],
+        max_concurrent=concurrency,
+    )
+    results = dict(zip((info.extension_id for info in cached), hashed))
 
     valid = 0
+    lines: list[str] = []
     for info in infos:
-        if not info.vsix_file.exists():
-            print(f"  ✗ {info.extension_id}: not found")
+        if info.extension_id not in results:
+            lines.append(f"  ✗ {info.extension_id}: not found")
+            continue
+
+        result = results[info.extension_id]
+        if isinstance(result, Exception):
+            lines.append(f"  ✗ {info.extension_id}: {result}")
             continue
 
-        digest, blocks = hasher.hash_file(info.vsix_file)
-        size_mb = info.vsix_file.stat().st_size / (1024 * 1024)
+        digest, blocks = result
+        size = _fmt_mb(info.size_bytes)
         hash_prefix = digest.hex()[:16]
-        msg = f"  ✓ {info.extension_id}: {size_mb:.1f}MB [{hash_prefix}] ({blocks} blocks)"
-        print(msg)
+        msg = f"  ✓ {info.extension_id}: {size} [{hash_prefix}] ({blocks} blocks)"
+        lines.append(msg)
         valid += 1
 
-    print(f"\nValid: {valid}/{len(extensions)}")
+    lines.append(f"\nValid: {valid}/{len(extensions)}")
+    _flush_lines(lines)
     return 0 if valid == len(extensions) else 1
 
 
 async def cmd_status(args: argparse.Namespace) -> int:
     """Show extension cache status."""
     extensions = args.extensions or KNOWN_EXTENSIONS
+    _warn_unknown(extensions)
     base_dir = Path(args.cache_dir) if args.cache_dir else None
     infos = [get_extension_info(ext, base_dir) for ext in extensions]
+    sizes = _scan_cache(base_dir or _DEFAULT_BASE, extensions)
 
     status: StatusReport = {
         "extensions": [],
@@ -189,8 +304,8 @@ async def cmd_status(args: argparse.Namespace) -> int:
     }
 
     for info in infos:
-        exists = info.vsix_file.exists()
-        size = info.vsix_file.stat().st_size if exists else 0
+        exists = info.extension_id in sizes
+        size = sizes.get(info.extension_id, 0)
 
         ext_status: ExtensionStatus = {
             "id": info.extension_id,
@@ -207,26 +322,88 @@ async def cmd_status(args: argparse.Namespace) -> int:
             status["summary"]["missing"] += 1
 
     if args.json:
-        print(json.dumps(status, indent=2))
+        if _HAS_ORJSON:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(
+                orjson.dumps(status, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+            )
+        else:
+            print(json.dumps(status, indent=2))
     else:
-        display_dir = base_dir or Path("/opt/extensions")
-        print(f"Extension Cache Status ({display_dir}):\n")
+        display_dir = base_dir or _DEFAULT_BASE
+        lines = [f"Extension Cache Status ({display_dir}):\n"]
         for ext in status["extensions"]:
             icon = "✓" if ext["cached"] else "✗"
             if ext["cached"]:
-                size = f"{ext['size_bytes'] / (1024 * 1024):.1f}MB"
+                size = _fmt_mb(ext["size_bytes"])
             else:
                 size = "missing"
             gpu = " [GPU]" if ext["gpu_required"] else ""
-            print(f"  {icon} {ext['id']}: {size}{gpu}")
+            lines.append(f"  {icon} {ext['id']}: {size}{gpu}")
 
         cached = status["summary"]["cached"]
         total = status["summary"]["total"]
-        print(f"\nSummary: {cached}/{total} cached")
+        lines.append(f"\nSummary: {cached}/{total} cached")
+        _flush_lines(lines)
 
     return 0
 
 
+# Subcommand table: (name, help, coroutine, [(flags, add_argument kwargs)])
+_EXTENSIONS_ARG: Final = (
+    ("extensions",),
+    {"nargs": "*", "help": "Extension IDs (default: all known)"},
+)
+
+_SUBCOMMANDS: Final = (
+    (
+        "download",
+        "Download extensions",
+        cmd_download,
+        [
+            _EXTENSIONS_ARG,
+            (
+                ("-c", "--concurrent"),
+                {"type": int, "default": 4, "help": "Maximum concurrent downloads"},
+            ),
+            (
+                ("--verify",),
+                {"action": "store_true", "default": True, "help": "Verify downloads with hash"},
+            ),
+            (
+                ("--no-verify",),
+                {"action": "store_false", "dest": "verify", "help": "Skip hash verification"},
+            ),
+        ],
+    ),
+    (
+        "verify",
+        "Verify cached extensions",
+        cmd_verify,
+        [
+            _EXTENSIONS_ARG,
+            (
+                ("--verify-concurrency",),
+                {
+                    "type": int,
+                    "default": None,
+                    "help": "Maximum files hashed at once (default: all, or 1 with GPU hashing)",
+                },
+            ),
+        ],
+    ),
+    (
+        "status",
+        "Show cache status",
+        cmd_status,
+        [
+            _EXTENSIONS_ARG,
+            (("--json",), {"action": "store_true", "help": "Output as JSON"}),
+        ],
+    ),
+)
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -260,53 +437,11 @@ Examples:
     )
 
     subparsers = parser.add_subparsers(dest="command", help="Commands")
-
-    # Download command
-    dl_parser = subparsers.add_parser("download", help="Download extensions")
-    dl_parser.add_argument(
-        "extensions",
-        nargs="*",
-        help="Extension IDs (default: all known)",
-    )
-    dl_parser.add_argument(
-        "-c", "--concurrent",
-        type=int,
-        default=4,
-        help="Maximum concurrent downloads",
-    )
-    dl_parser.add_argument(
-        "--verify",
-        action="store_true",
-        default=True,
-        help="Verify downloads with hash",
-    )
-    dl_parser.add_argument(
-        "--no-verify",
-        action="store_false",
-        dest="verify",
-        help="Skip hash verification",
-    )
-
-    # Verify command
-    verify_parser = subparsers.add_parser("verify", help="Verify cached extensions")
-    verify_parser.add_argument(
-        "extensions",
-        nargs="*",
-        help="Extension IDs (default: all known)",
-    )
-
-    # Status command
-    status_parser = subparsers.add_parser("status", help="Show cache status")
-    status_parser.add_argument(
-        "extensions",
-        nargs="*",
-        help="Extension IDs (default: all known)",
-    )
-    status_parser.add_argument(
-        "--json",
-        action="store_true",
-        help="Output as JSON",
-    )
+    for name, help_text, func, options in _SUBCOMMANDS:
+        sub = subparsers.add_parser(name, help=help_text)
+        for flags, kwargs in options:
+            sub.add_argument(*flags, **kwargs)
+        sub.set_defaults(func=func)
 
     args = parser.parse_args()
 
@@ -315,14 +450,7 @@ Examples:
         return 0
 
     # Run async command
-    if args.command == "download":
-        return asyncio.run(cmd_download(args))
-    elif args.command == "verify":
-        return asyncio.run(cmd_verify(args))
-    elif args.command == "status":
-        return asyncio.run(cmd_status(args))
-
-    return 0
+    return asyncio.run(args.func(args))
 
 
 if __name__ == "__main__":
@@ -7,7 +7,9 @@ import sys
 from pathlib import Path
 
 # Add parent to path for shared modules
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+_PARENT = Path(__file__).resolve().parent.parent
+if str(_PARENT) not in sys.path:
+    sys.path.insert(0, str(_PARENT))
 
 from base_handler import create_handler
 
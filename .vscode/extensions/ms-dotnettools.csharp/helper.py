@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 from typing import Final
 
@@ -32,9 +33,13 @@ class ExtensionContext:
 
     @property
     def is_cached(self) -> bool:
-        return self.vsix_file.exists() and self.vsix_file.stat().st_size > 0
+        try:
+            return self.vsix_file.stat().st_size > 0
+        except FileNotFoundError:
+            return False
 
 
+@cache
 def get_context() -> ExtensionContext:
     """Return tensor-optimized context for C# extension."""
     extension_dir = Path(__file__).resolve().parent
@@ -4,7 +4,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
+from typing import Final
+
+# Cache layout as prebuilt strings, so get_context() builds each Path once
+_CACHE_STR: Final[str] = "/opt/extensions/ms-dotnettools.dotnet-interactive-vscode"
+_VSIX_STR: Final[str] = _CACHE_STR + "/ms-dotnettools.dotnet-interactive-vscode.vsix"
 
 
 @dataclass(frozen=True, slots=True)
@@ -18,14 +24,14 @@ class ExtensionContext:
     fetcher: Path
 
 
+@cache
 def get_context() -> ExtensionContext:
     """Return metadata for the .NET Interactive extension cache."""
     extension_dir = Path(__file__).resolve().parent
-    cache_dir = Path("/opt/extensions") / "ms-dotnettools.dotnet-interactive-vscode"
     return ExtensionContext(
         extension_id="ms-dotnettools.dotnet-interactive-vscode",
-        cache_dir=cache_dir,
-        vsix_file=cache_dir / "ms-dotnettools.dotnet-interactive-vscode.vsix",
+        cache_dir=Path(_CACHE_STR),
+        vsix_file=Path(_VSIX_STR),
         extension_dir=extension_dir,
         fetcher=extension_dir.parent / "fetch_extension.py",
     )
@@ -17,9 +17,11 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Final
 
 # Add parent to path for shared modules
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+_PARENT = Path(__file__).resolve().parent.parent
+if str(_PARENT) not in sys.path:
+    sys.path.insert(0, str(_PARENT))
 
-from fetch_extension import TensorDownloader, GPUHasher, _HAS_AIOHTTP
+from fetch_extension import TensorDownloader, GPUHasher, _HAS_AIOHTTP, fetch
 from helper import get_context
 
 if TYPE_CHECKING:
@@ -67,17 +69,8 @@ def main(argv: list[str] | None = None) -> None:
         exit_code = asyncio.run(download_async(context))
         sys.exit(exit_code)
     else:
-        # Legacy subprocess fallback
-        import subprocess
-        env = os.environ.copy()
-        env["EXTENSION_ID"] = context.extension_id
-        env["EXTENSION_CACHE"] = str(context.cache_dir)
-        subprocess.run(
-            [sys.executable, str(context.fetcher)],
-            check=True,
-            env=env,
-            cwd=context.extension_dir,
-        )
+        # Legacy in-process fallback (urllib)
+        sys.exit(fetch(context.extension_id, context.cache_dir))
 
 
 if __name__ == "__main__":
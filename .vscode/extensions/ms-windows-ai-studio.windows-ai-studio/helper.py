@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 from typing import Final
 
@@ -49,17 +50,19 @@ class ExtensionContext:
 
     @property
     def size_bytes(self) -> int:
-        """Get cached VSIX file size, or 0 if not present."""
-        if self.vsix_file.exists():
+        """Get cached VSIX file size, or 0 if not present (one stat)."""
+        try:
             return self.vsix_file.stat().st_size
-        return 0
+        except FileNotFoundError:
+            return 0
 
     @property
     def is_cached(self) -> bool:
         """Check if extension is already downloaded."""
-        return self.vsix_file.exists() and self.size_bytes > 0
+        return self.size_bytes > 0
 
 
+@cache
 def get_context() -> ExtensionContext:
     """Return tensor-optimized context for Windows AI Studio extension."""
     extension_dir = Path(__file__).resolve().parent
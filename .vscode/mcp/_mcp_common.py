@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Shared compose metadata for the MCP container helpers."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Final
+
+COMPOSE_FILE_NAME: Final[str] = "docker-compose.mcp.yml"
+
+
+@dataclass(frozen=True, slots=True)
+class MCPContext:
+    """Describe the Docker compose configuration for the MCP service."""
+
+    service_name: str
+    compose_file: Path
+    project_root: Path
+    # Set only for services whose handler talks to the Docker engine directly
+    container_name: str | None = None
+
+    # ``docker compose -f <file>`` prefix, built once per context
+    compose_base: tuple[str, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the compose command prefix."""
+        object.__setattr__(
+            self,
+            "compose_base",
+            ("docker", "compose", "-f", os.fspath(self.compose_file)),
+        )
+
+
+@cache
+def make_context(
+    helper_file: str, service_name: str, container_name: str | None = None
+) -> MCPContext:
+    """Return compose metadata for the service whose helper is ``helper_file``.
+
+    Cached per (helper, service) so each helper resolves its path once even
+    when both MCP services are driven from the same process.
+    """
+    root = Path(helper_file).resolve().parents[1]
+    # The shared compose file defines the volumes and nvidia runtime
+    return MCPContext(
+        service_name=service_name,
+        compose_file=root / COMPOSE_FILE_NAME,
+        project_root=root,
+        container_name=container_name,
+    )
@@ -4,58 +4,102 @@
 from __future__ import annotations
 
 import os
+import shutil
 import subprocess
 import sys
-from pathlib import Path
+from typing import NoReturn
 
-from helper import get_context
+from helper import MCPContext, get_context
 
 VALID_ACTIONS = {"up", "down", "logs"}
+# Compose arguments per action; the service name is appended after them.
+# Only "up" needs compose; the other actions are in ENGINE_ACTIONS below.
+_COMPOSE_TAIL: dict[str, tuple[str, ...]] = {
+    "up": ("up", "-d"),
+}
+# Actions on an already-created container go straight to the Docker engine,
+# skipping compose's YAML parsing and project resolution.
+ENGINE_ACTIONS = {"down", "logs"}
+_ENGINE_TAIL: dict[str, tuple[str, ...]] = {
+    "down": ("stop",),
+    "logs": ("logs", "-f"),
+}
+
+
+def _build_command(action: str, context: MCPContext) -> list[str]:
+    tail = _COMPOSE_TAIL.get(action)
+    if tail is None:
+        raise ValueError(f"Unsupported action '{action}'")
+    return [*context.compose_base, *tail, context.service_name]
+
+
+def _engine_command(action: str, container_name: str) -> list[str]:
+    tail = _ENGINE_TAIL.get(action)
+    if tail is None:
+        raise ValueError(f"Unsupported engine action '{action}'")
+    return ["docker", *tail, container_name]
+
+
+def _run(command: list[str]) -> None:
+    print(f"Executing: {' '.join(command)}")
+    # An absolute executable, inherited fds and no cwd switch let CPython
+    # launch the child with posix_spawn instead of fork+exec.
+    subprocess.run(  # noqa: S603
+        command,
+        check=True,
+        executable=shutil.which(command[0]),
+        stdin=subprocess.DEVNULL,
+        close_fds=False,
+    )
 
 
-def _compose_base(compose_file: Path) -> list[str]:
-    return ["docker", "compose", "-f", str(compose_file)]
-
-
-def _build_command(action: str, service_name: str, compose_file: Path) -> list[str]:
-    base = _compose_base(compose_file)
-    if action == "up":
-        return base + ["up", "-d", service_name]
-    if action == "down":
-        return base + ["stop", service_name]
-    if action == "logs":
-        return base + ["logs", "-f", service_name]
-    raise ValueError(f"Unsupported action '{action}'")
+def _exec(command: list[str]) -> NoReturn:
+    """Replace this process with ``command``; used for ``logs -f``."""
+    print(f"Executing: {' '.join(command)}", flush=True)
+    os.execvp(command[0], command)  # noqa: S606
 
 
 def main(argv: list[str] | None = None) -> None:
-    """Control the Aspire Dashboard MCP service via docker compose."""
+    """Control the Aspire Dashboard MCP service via docker compose.
+
+    Several actions can be batched in one call as a comma-separated list
+    (e.g. ``up,logs``); extra arguments are appended to the last one.
+    """
     args = argv or sys.argv[1:]
-    action = args[0] if args else "up"
+    actions = (args[0] if args else "up").split(",")
     extra_args = args[1:]
-    if action not in VALID_ACTIONS:
+    if not set(actions) <= VALID_ACTIONS:
         raise SystemExit(f"Action must be one of {sorted(VALID_ACTIONS)}")
 
     context = get_context()
-    command = _build_command(action, context.service_name, context.compose_file)
-    command.extend(extra_args)
-
-    env = os.environ.copy()
-    env.setdefault("PYTHON_GIL", "0")
-    env["MCP_SERVICE"] = context.service_name
+    assert context.container_name is not None  # Set by this service's helper
+    commands = [
+        _engine_command(action, context.container_name)
+        if action in ENGINE_ACTIONS
+        else _build_command(action, context)
+        for action in actions
+    ]
+    commands[-1].extend(extra_args)
+
+    # Short-lived process: set the child's variables on our own environment
+    # rather than copying it, and let subprocess inherit it as-is.
+    os.environ.setdefault("PYTHON_GIL", "0")
+    os.environ["MCP_SERVICE"] = context.service_name
+    # Run from the project root so children need no per-spawn cwd switch
+    os.chdir(context.project_root)
 
     # Ensure the data volume directory exists if mapped locally (optional, but good practice)
     # Docker compose usually handles named volumes, but if bind mounts are used:
     # data_dir = context.project_root / "data"
     # data_dir.mkdir(exist_ok=True)
 
-    print(f"Executing: {' '.join(command)}")
-    subprocess.run(  # noqa: S603
-        command,
-        check=True,
-        env=env,
-        cwd=context.project_root,
-    )
+    *leading, last = commands
+    for command in leading:
+        _run(command)
+    if actions[-1] == "logs":
+        # Following logs never returns on its own; hand the terminal to docker
+        _exec(last)
+    _run(last)
 
 
 if __name__ == "__main__":
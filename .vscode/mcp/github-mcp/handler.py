@@ -4,28 +4,46 @@
 from __future__ import annotations
 
 import os
+import shutil
 import subprocess
 import sys
-from pathlib import Path
+from typing import NoReturn
 
-from helper import get_context
+from helper import MCPContext, get_context
 
 VALID_ACTIONS = {"up", "down", "logs"}
+# Compose arguments per action; the service name is appended after them
+_COMPOSE_TAIL: dict[str, tuple[str, ...]] = {
+    "up": ("up", "-d"),
+    "down": ("stop",),
+    "logs": ("logs", "-f"),
+}
 
 
-def _compose_base(compose_file: Path) -> list[str]:
-    return ["docker", "compose", "-f", str(compose_file)]
+def _build_command(action: str, context: MCPContext) -> list[str]:
+    tail = _COMPOSE_TAIL.get(action)
+    if tail is None:
+        raise ValueError(f"Unsupported action '{action}'")
+    return [*context.compose_base, *tail, context.service_name]
 
 
-def _build_command(action: str, service_name: str, compose_file: Path) -> list[str]:
-    base = _compose_base(compose_file)
-    if action == "up":
-        return base + ["up", "-d", service_name]
-    if action == "down":
-        return base + ["stop", service_name]
-    if action == "logs":
-        return base + ["logs", "-f", service_name]
-    raise ValueError(f"Unsupported action '{action}'")
+def _run(command: list[str]) -> None:
+    print(f"Executing: {' '.join(command)}")
+    # An absolute executable, inherited fds and no cwd switch let CPython
+    # launch the child with posix_spawn instead of fork+exec.
+    subprocess.run(  # noqa: S603
+        command,
+        check=True,
+        executable=shutil.which(command[0]),
+        stdin=subprocess.DEVNULL,
+        close_fds=False,
+    )
+
+
+def _exec(command: list[str]) -> NoReturn:
+    """Replace this process with ``command``; used for ``logs -f``."""
+    print(f"Executing: {' '.join(command)}", flush=True)
+    os.execvp(command[0], command)  # noqa: S606
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -37,22 +55,20 @@ def main(argv: list[str] | None = None) -> None:
         raise SystemExit(f"Action must be one of {sorted(VALID_ACTIONS)}")
 
     context = get_context()
-    command = _build_command(
-        action, context.service_name, context.compose_file
-    )
+    command = _build_command(action, context)
     command.extend(extra_args)
 
-    env = os.environ.copy()
-    env.setdefault("PYTHON_GIL", "0")
-    env["MCP_SERVICE"] = context.service_name
+    # Short-lived process: set the child's variables on our own environment
+    # rather than copying it, and let subprocess inherit it as-is.
+    os.environ.setdefault("PYTHON_GIL", "0")
+    os.environ["MCP_SERVICE"] = context.service_name
+    # Run from the project root so children need no per-spawn cwd switch
+    os.chdir(context.project_root)
 
-    print(f"Executing: {' '.join(command)}")
-    subprocess.run(  # noqa: S603
-        command,
-        check=True,
-        env=env,
-        cwd=context.project_root,
-    )
+    if action == "logs":
+        # Following logs never returns on its own; hand the terminal to docker
+        _exec(command)
+    _run(command)
 
 
 if __name__ == "__main__":
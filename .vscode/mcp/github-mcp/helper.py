@@ -3,25 +3,19 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
 from pathlib import Path
 
+# Add parent to path for the shared MCP module
+_PARENT = Path(__file__).resolve().parent.parent
+if str(_PARENT) not in sys.path:
+    sys.path.insert(0, str(_PARENT))
 
-@dataclass(frozen=True, slots=True)
-class MCPContext:
-    """Describe the Docker compose configuration for the MCP service."""
+from _mcp_common import MCPContext, make_context  # noqa: E402
 
-    service_name: str
-    compose_file: Path
-    project_root: Path
+__all__ = ["MCPContext", "get_context"]
 
 
 def get_context() -> MCPContext:
     """Return compose metadata for the GitHub MCP service."""
-    root = Path(__file__).resolve().parents[1]
-    # Point compose file that defines the volumes and nvidia runtime
-    return MCPContext(
-        service_name="github-mcp",
-        compose_file=root / "docker-compose.mcp.yml",
-        project_root=root,
-    )
+    return make_context(__file__, "github-mcp")
@@ -11,12 +11,19 @@ import importlib
 import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, TypedDict
 
 # Dynamic import for yaml - types-PyYAML stub not required
 _yaml_module: Any = importlib.import_module("yaml")
 
+# orjson parses uv's raw stdout bytes without a separate UTF-8 decode pass
+try:
+    _loads: Any = importlib.import_module("orjson").loads
+except ImportError:
+    _loads = json.loads
+
 
 class InstalledPackage(TypedDict):
     """Represents an installed package from uv pip list."""
@@ -70,15 +77,14 @@ def get_installed_packages() -> list[InstalledPackage]:
         result = subprocess.run(
             ["uv", "pip", "list", "--format=json"],
             capture_output=True,
-            text=True,
             check=True,
         )
-        data: list[InstalledPackage] = json.loads(result.stdout)
+        data: list[InstalledPackage] = _loads(result.stdout)
         return data
     except subprocess.CalledProcessError as e:
         print(f"Error getting installed packages: {e}")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print(f"Error decoding JSON from uv pip list: {e}")
         sys.exit(1)
 
@@ -97,15 +103,14 @@ def get_outdated_packages() -> list[OutdatedPackage]:
         result = subprocess.run(
             ["uv", "pip", "list", "--outdated", "--format=json"],
             capture_output=True,
-            text=True,
             check=True,
         )
-        data: list[OutdatedPackage] = json.loads(result.stdout)
+        data: list[OutdatedPackage] = _loads(result.stdout)
         return data
     except subprocess.CalledProcessError:
         # Fallback if json format not supported or other error
         return []
-    except json.JSONDecodeError:
+    except ValueError:
         return []
 
 
@@ -113,8 +118,13 @@ def generate_report() -> None:
     """
     Generates the dependency report and saves it to `python-deps.config.yaml`.
     """
-    installed = get_installed_packages()
-    outdated = get_outdated_packages()
+    # The two uv invocations are independent; the outdated check queries the
+    # index over the network, so run it alongside the local listing.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        installed_future = executor.submit(get_installed_packages)
+        outdated_future = executor.submit(get_outdated_packages)
+        installed = installed_future.result()
+        outdated = outdated_future.result()
 
     outdated_map: dict[str, OutdatedPackage] = {pkg["name"]: pkg for pkg in outdated}
 
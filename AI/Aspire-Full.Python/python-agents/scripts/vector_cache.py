@@ -10,12 +10,22 @@ Optimized for Python 3.15 free-threading with concurrent operations.
 
 from __future__ import annotations
 
+import asyncio
 import importlib
+import importlib.util
+import json
+import logging
+import os
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import StrEnum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final
+from urllib.parse import urlsplit
 
 # Add src to path for vendor imports
 _SCRIPT_DIR = Path(__file__).parent
@@ -25,7 +35,25 @@ if str(_SRC_DIR) not in sys.path:
     sys.path.insert(0, str(_SRC_DIR))
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
+
+# orjson encodes straight to UTF-8 bytes (which Redis stores as-is) and is
+# several times faster than stdlib json on metadata dicts
+try:
+    _orjson: Any = importlib.import_module("orjson")
+    _dumps: Any = _orjson.dumps
+    _loads: Any = _orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# NumPy ships with qdrant-client; without it vectors fall back to plain lists
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger: Final[logging.Logger] = logging.getLogger(__name__)
 
 # ============================================================================
 # Constants
@@ -33,8 +61,23 @@ if TYPE_CHECKING:
 
 DEFAULT_REDIS_URL: Final[str] = "redis://localhost:6379/0"
 DEFAULT_QDRANT_URL: Final[str] = "http://localhost:6333"
+DEFAULT_QDRANT_GRPC_PORT: Final[int] = 6334
 DEFAULT_COLLECTION_NAME: Final[str] = "aspire_vectors"
 DEFAULT_VECTOR_SIZE: Final[int] = 384  # all-MiniLM-L6-v2 dimension
+# Redis key prefix for vector metadata. Values are JSON (orjson-encoded):
+# the client is shared and created with decode_responses=True, so binary
+# encodings such as msgpack would fail to decode on read. Switching encodings
+# means a new prefix (e.g. "vec:meta:v2:") plus a migrating read path.
+META_KEY_PREFIX: Final[str] = "vec:meta:"
+# Seconds a Redis ping result is reused by VectorCache.stats
+PING_CACHE_TTL: Final[float] = 5.0
+# Points per request when large batches are streamed via upload_collection
+UPLOAD_BATCH_SIZE: Final[int] = 512
+# Float32 vectors VectorCache.search_rerank keeps in memory for rescoring
+RERANK_CACHE_SIZE: Final[int] = 10_000
+# Payload field holding the per-vector scale under client_quantization;
+# internal, so it is stripped from search results
+SCALE_PAYLOAD_KEY: Final[str] = "_scale"
 
 
 # ============================================================================
@@ -89,6 +132,11 @@ class QdrantConfig:
     """Qdrant connection configuration."""
 
     url: str = DEFAULT_QDRANT_URL
+    # Opt-in: gRPC needs grpcio and port 6334 reachable (the devcontainer
+    # forwards only the REST port 6333); REST is used otherwise
+    prefer_grpc: bool = False
+    grpc_port: int = DEFAULT_QDRANT_GRPC_PORT
+    timeout: int = 30
     collection_name: str = DEFAULT_COLLECTION_NAME
     vector_size: int = DEFAULT_VECTOR_SIZE
     distance_metric: VectorDistanceMetric = VectorDistanceMetric.COSINE
@@ -96,9 +144,15 @@ class QdrantConfig:
     # Memory optimization settings
     on_disk_payload: bool = True  # Store payloads on disk
     quantization_enabled: bool = True  # Scalar quantization for 4x memory reduction
+    # Snap cosine vectors to a per-vector INT8 grid before upload; the scale
+    # is kept in the payload as "_scale". Shrinks REST (JSON) request bodies
+    # several-fold; with prefer_grpc floats are 4 bytes either way, so there
+    # is no gain. The grid replaces the float32 originals for good, so server
+    # rescoring and VectorCache.search_rerank score against quantized vectors.
+    client_quantization: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VectorSearchResult:
     """Result from vector similarity search."""
 
@@ -108,6 +162,72 @@ class VectorSearchResult:
     vector: list[float] | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class SearchBatch:
+    """Search hits as parallel columns instead of one object per hit.
+
+    ``scores`` is a float32 array when NumPy is available. ``payloads`` is
+    None when the search was run with ``return_payload=False``.
+    """
+
+    ids: list[str]
+    scores: "np.ndarray | list[float]"
+    payloads: "list[dict[str, Any]] | None" = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def _quantize_int8(matrix: "np.ndarray") -> "tuple[np.ndarray, np.ndarray]":
+    """Symmetric absmax INT8 quantization of each row.
+
+    Returns the quantized rows and their per-row scales, such that
+    ``rows * scales[:, None]`` approximates ``matrix``.
+    """
+    scales = np.abs(matrix).max(axis=1) / 127.0
+    # All-zero rows would divide by zero; any scale maps them to zeros
+    safe = np.where(scales > 0.0, scales, 1.0)
+    rows = np.clip(np.rint(matrix / safe[:, None]), -127, 127).astype(np.int8)
+    return rows, scales
+
+
+def _query_array(query_vector: "Sequence[float] | np.ndarray") -> Any:
+    """Return a query vector in a form qdrant-client accepts without copying."""
+    if np is None:
+        return list(query_vector)
+    # No-op for float32 arrays already; one C-level conversion otherwise
+    return np.asarray(query_vector, dtype=np.float32)
+
+
+def _vector_rows(vectors: "Sequence[Sequence[float]] | np.ndarray") -> list[list[float]]:
+    """Convert a batch of vectors to the nested lists Qdrant's models accept."""
+    if np is None:
+        return [list(v) for v in vectors]
+    # tolist() unboxes the whole float32 matrix in C instead of per element
+    return np.ascontiguousarray(vectors, dtype=np.float32).tolist()
+
+
+def _strip_scale(payload: dict[str, Any] | None) -> dict[str, Any]:
+    """Return ``payload`` without the internal quantization scale."""
+    if not payload or SCALE_PAYLOAD_KEY not in payload:
+        return payload or {}
+    return {k: v for k, v in payload.items() if k != SCALE_PAYLOAD_KEY}
+
+
+def _to_results(
+    points: "Iterable[Any]", strip_scale: bool = False
+) -> list[VectorSearchResult]:
+    """Convert Qdrant scored points into search results.
+
+    The class is bound to a local and constructed positionally, so the
+    per-hit cost is one call without global or keyword lookups.
+    """
+    result = VectorSearchResult
+    if strip_scale:
+        return [result(str(p.id), p.score, _strip_scale(p.payload), p.vector) for p in points]
+    return [result(str(p.id), p.score, p.payload or {}, p.vector) for p in points]
+
+
 # ============================================================================
 # Redis Client Abstraction
 # ============================================================================
@@ -120,8 +240,18 @@ class RedisClientManager:
         super().__init__()
         self.config = config or RedisConfig()
         self._client: Any = None
+        self._aclient: Any = None
         self._pool: Any = None
 
+    def _client_kwargs(self) -> dict[str, Any]:
+        """Connection options shared by the sync and async clients."""
+        return {
+            "max_connections": self.config.max_connections,
+            "socket_timeout": self.config.socket_timeout,
+            "socket_connect_timeout": self.config.socket_connect_timeout,
+            "decode_responses": self.config.decode_responses,
+        }
+
     def _get_client(self) -> Any:
         """Get or create Redis client using vendor abstraction."""
         if self._client is not None:
@@ -130,18 +260,25 @@ class RedisClientManager:
         try:
             from aspire_agents._vendor._redis import from_url
 
-            self._client = from_url(
-                self.config.url,
-                max_connections=self.config.max_connections,
-                socket_timeout=self.config.socket_timeout,
-                socket_connect_timeout=self.config.socket_connect_timeout,
-                decode_responses=self.config.decode_responses,
-            )
+            self._client = from_url(self.config.url, **self._client_kwargs())
             return self._client
         except (ImportError, RuntimeError) as e:
-            print(f"Redis not available: {e}")
+            logger.warning("Redis not available: %s", e)
             return None
 
+    def _get_async_client(self) -> Any:
+        """Get or create the ``redis.asyncio`` client."""
+        if self._aclient is not None:
+            return self._aclient
+
+        try:
+            redis_asyncio: Any = importlib.import_module("redis.asyncio")
+        except ImportError as e:
+            logger.warning("Redis not available: %s", e)
+            return None
+        self._aclient = redis_asyncio.from_url(self.config.url, **self._client_kwargs())
+        return self._aclient
+
     def get(self, key: str) -> str | None:
         """Get value from Redis."""
         client = self._get_client()
@@ -150,7 +287,7 @@ class RedisClientManager:
         return client.get(key)
 
     def set(
-        self, key: str, value: str, ex: int | None = None
+        self, key: str, value: str | bytes, ex: int | None = None
     ) -> bool:
         """Set value in Redis with optional expiration."""
         client = self._get_client()
@@ -158,6 +295,22 @@ class RedisClientManager:
             return False
         return client.set(key, value, ex=ex)
 
+    def set_many(
+        self, mapping: "dict[str, str | bytes]", ex: int | None = None
+    ) -> bool:
+        """Set several keys in one round-trip, with optional expiration."""
+        client = self._get_client()
+        if client is None:
+            return False
+        pipe = client.pipeline(transaction=False)
+        if ex is None:
+            pipe.mset(mapping)
+        else:
+            # MSET takes no expiry, so queue SET ... EX per key instead
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=ex)
+        return all(pipe.execute())
+
     def delete(self, key: str) -> int:
         """Delete key from Redis."""
         client = self._get_client()
@@ -182,6 +335,22 @@ class RedisClientManager:
         except Exception:
             return False
 
+    async def ping_async(self) -> bool:
+        """Check Redis connectivity without blocking the event loop."""
+        client = self._get_async_client()
+        if client is None:
+            return False
+        try:
+            return bool(await client.ping())
+        except Exception:
+            return False
+
+    async def close_async(self) -> None:
+        """Close the async client; it is bound to the running event loop."""
+        client, self._aclient = self._aclient, None
+        if client is not None:
+            await client.aclose()
+
 
 # ============================================================================
 # Qdrant Client Abstraction
@@ -195,20 +364,150 @@ class QdrantClientManager:
         super().__init__()
         self.config = config or QdrantConfig()
         self._client: Any = None
+        self._aclient: Any = None
+        # Static collection fields for get_collection_info, filled on first use
+        self._schema: dict[str, Any] | None = None
+        # Cosine similarity ignores per-vector scale, so the INT8 grid can be
+        # stored as-is; other metrics would need the scale applied server-side.
+        self._quantize_upload = (
+            self.config.client_quantization
+            and self.config.distance_metric == VectorDistanceMetric.COSINE
+            and np is not None
+        )
+        # Resolve qdrant-client once; a per-call import_module() takes the
+        # import lock, which contends across threads on free-threaded builds.
+        try:
+            qdrant_module: Any = importlib.import_module("qdrant_client")
+            self._client_class: Any = getattr(qdrant_module, "QdrantClient")
+            self._async_client_class: Any = getattr(qdrant_module, "AsyncQdrantClient")
+            self._models: Any = importlib.import_module("qdrant_client.models")
+        except ImportError:
+            self._client_class = None
+            self._async_client_class = None
+            self._models = None
+
+        # Search-time quantization settings never change, so build them once:
+        # scan the in-RAM INT8 vectors, then rescore an oversampled candidate
+        # set against the on-disk originals.
+        self._search_params: Any = None
+        # INT8 scan only, for callers that rescore candidates themselves
+        self._scan_params: Any = None
+        if self.config.quantization_enabled and self._models is not None:
+            self._search_params = self._models.SearchParams(
+                quantization=self._models.QuantizationSearchParams(
+                    ignore=False,
+                    rescore=True,
+                    oversampling=2.0,
+                )
+            )
+            self._scan_params = self._models.SearchParams(
+                quantization=self._models.QuantizationSearchParams(
+                    ignore=False,
+                    rescore=False,
+                )
+            )
 
     def _get_client(self) -> Any:
         """Get or create Qdrant client."""
         if self._client is not None:
             return self._client
 
-        try:
-            qdrant_module: Any = importlib.import_module("qdrant_client")
-            client_class: Any = getattr(qdrant_module, "QdrantClient")
-            self._client = client_class(url=self.config.url)
-            return self._client
-        except ImportError:
-            print("qdrant-client not installed. Install with: pip install qdrant-client")
+        if self._client_class is None:
+            logger.warning("qdrant-client not installed. Install with: pip install qdrant-client")
+            return None
+        self._client = self._client_class(**self._client_kwargs())
+        return self._client
+
+    def _get_async_client(self) -> Any:
+        """Get or create the ``AsyncQdrantClient``."""
+        if self._aclient is not None:
+            return self._aclient
+
+        if self._async_client_class is None:
+            logger.warning("qdrant-client not installed. Install with: pip install qdrant-client")
             return None
+        self._aclient = self._async_client_class(**self._client_kwargs())
+        return self._aclient
+
+    def _client_kwargs(self) -> dict[str, Any]:
+        """Connection options shared by the sync and async clients."""
+        client_kwargs: dict[str, Any] = {
+            "url": self.config.url,
+            "timeout": self.config.timeout,
+        }
+        # qdrant-client turns REST keep-alive off for localhost on purpose (it
+        # can add delays there); keep that default and only pool keep-alive
+        # connections for remote hosts.
+        if urlsplit(self.config.url).hostname not in ("localhost", "127.0.0.1"):
+            httpx_module: Any = importlib.import_module("httpx")
+            client_kwargs["limits"] = httpx_module.Limits(
+                max_connections=64, max_keepalive_connections=32
+            )
+        # gRPC multiplexes concurrent calls over one HTTP/2 connection with a
+        # smaller wire format; keep-alive pings hold that connection open.
+        if self.config.prefer_grpc and importlib.util.find_spec("grpc") is not None:
+            client_kwargs.update(
+                prefer_grpc=True,
+                grpc_port=self.config.grpc_port,
+                grpc_options={
+                    "grpc.keepalive_time_ms": 30000,
+                    "grpc.http2.max_pings_without_data": 0,
+                },
+            )
+        return client_kwargs
+
+    def _collection_spec(self) -> dict[str, Any]:
+        """Build the ``create_collection`` arguments with optimized settings."""
+        qdrant_models = self._models
+
+        # Create collection with memory-optimized settings
+        vector_config = qdrant_models.VectorParams(
+            size=self.config.vector_size,
+            distance=qdrant_models.Distance(self.config.distance_metric),
+            # With quantization the float32 originals are only read to
+            # rescore candidates, so they can live on disk.
+            on_disk=(
+                self.config.quantization_enabled
+                or self.config.indexing_mode == IndexingMode.ON_DISK
+            ),
+        )
+
+        # Optimizers for low memory footprint
+        # Thresholds are per-segment vector data in KB. A higher indexing
+        # threshold rebuilds HNSW less often during ingest; one segment per
+        # core lets a search fan out across all of them.
+        optimizers_config = qdrant_models.OptimizersConfigDiff(
+            memmap_threshold=50000,  # mmap segments above ~50 MB
+            indexing_threshold=50000,
+            default_segment_number=os.cpu_count() or 1,
+        )
+
+        # Quantization for 4x memory reduction
+        quantization_config = None
+        if self.config.quantization_enabled:
+            quantization_config = qdrant_models.ScalarQuantization(
+                scalar=qdrant_models.ScalarQuantizationConfig(
+                    type=qdrant_models.ScalarType.INT8,
+                    quantile=0.99,  # Clip outliers for a tighter INT8 range
+                    always_ram=True,  # Pin the small INT8 copy for scans
+                )
+            )
+
+        return {
+            "collection_name": self.config.collection_name,
+            "vectors_config": vector_config,
+            "optimizers_config": optimizers_config,
+            "quantization_config": quantization_config,
+            "on_disk_payload": self.config.on_disk_payload,
+        }
+
+    def _collection_created(self) -> None:
+        """Record the schema of a collection this manager just created."""
+        self._schema = {
+            "name": self.config.collection_name,
+            "vector_size": self.config.vector_size,
+        }
+        logger.info("Created collection: %s", self.config.collection_name)
 
     def ensure_collection(self) -> bool:
         """Ensure collection exists with optimized settings."""
@@ -217,95 +516,122 @@ class QdrantClientManager:
             return False
 
         try:
-            qdrant_models: Any = importlib.import_module("qdrant_client.models")
-
             # Check if collection exists
             collections = client.get_collections().collections
-            collection_names = [c.name for c in collections]
-
-            if self.config.collection_name in collection_names:
+            if any(c.name == self.config.collection_name for c in collections):
                 return True
 
-            # Create collection with memory-optimized settings
-            vector_config = qdrant_models.VectorParams(
-                size=self.config.vector_size,
-                distance=getattr(qdrant_models.Distance, self.config.distance_metric),
-                on_disk=self.config.indexing_mode == IndexingMode.ON_DISK,
-            )
+            client.create_collection(**self._collection_spec())
+            self._collection_created()
+            return True
 
-            # Optimizers for low memory footprint
-            optimizers_config = qdrant_models.OptimizersConfigDiff(
-                memmap_threshold=20000,  # Use mmap for segments > 20k vectors
-                indexing_threshold=20000,
-            )
+        except Exception:
+            logger.exception("Failed to ensure collection")
+            return False
 
-            # Quantization for 4x memory reduction
-            quantization_config = None
-            if self.config.quantization_enabled:
-                quantization_config = qdrant_models.ScalarQuantization(
-                    scalar=qdrant_models.ScalarQuantizationConfig(
-                        type=qdrant_models.ScalarType.INT8,
-                        always_ram=False,  # Keep quantized on disk
-                    )
-                )
+    async def ensure_collection_async(self) -> bool:
+        """Async variant of :meth:`ensure_collection`."""
+        client = self._get_async_client()
+        if client is None:
+            return False
 
-            client.create_collection(
-                collection_name=self.config.collection_name,
-                vectors_config=vector_config,
-                optimizers_config=optimizers_config,
-                quantization_config=quantization_config,
-                on_disk_payload=self.config.on_disk_payload,
-            )
+        try:
+            collections = (await client.get_collections()).collections
+            if any(c.name == self.config.collection_name for c in collections):
+                return True
 
-            print(f"Created collection: {self.config.collection_name}")
+            await client.create_collection(**self._collection_spec())
+            self._collection_created()
             return True
 
-        except Exception as e:
-            print(f"Failed to ensure collection: {e}")
+        except Exception:
+            logger.exception("Failed to ensure collection")
             return False
 
     def upsert_vectors(
         self,
         ids: "Sequence[str]",
-        vectors: "Sequence[Sequence[float]]",
+        vectors: "Sequence[Sequence[float]] | np.ndarray",
         payloads: "Sequence[dict[str, Any]] | None" = None,
+        *,
+        wait: bool = True,
     ) -> bool:
-        """Upsert vectors with optional payloads."""
+        """Upsert vectors with optional payloads.
+
+        ``vectors`` may be a 2-D array; it is converted to contiguous float32
+        once for the whole batch rather than copied point by point. Batches
+        larger than ``UPLOAD_BATCH_SIZE`` are streamed with
+        ``upload_collection``. With ``wait=False`` Qdrant acknowledges once the
+        write is queued in its WAL, skipping the wait for the points to be
+        applied.
+        """
         client = self._get_client()
         if client is None:
             return False
 
         try:
-            qdrant_models: Any = importlib.import_module("qdrant_client.models")
-
-            points: list[Any] = []
-            for i, (point_id, vector) in enumerate(zip(ids, vectors, strict=False)):
-                payload = payloads[i] if payloads else {}
-                points.append(
-                    qdrant_models.PointStruct(
-                        id=point_id,
-                        vector=list(vector),
-                        payload=payload,
+            qdrant_models = self._models
+
+            payload_list = list(payloads) if payloads else None
+            matrix = None if np is None else np.ascontiguousarray(vectors, dtype=np.float32)
+            if self._quantize_upload:
+                rows, scales = _quantize_int8(matrix)
+                # Small integral floats serialize far shorter than full floats
+                matrix = rows.astype(np.float32)
+                payload_list = [
+                    {**payload, SCALE_PAYLOAD_KEY: scale}
+                    for payload, scale in zip(
+                        payload_list or [{}] * len(scales), scales.tolist(), strict=True
                     )
+                ]
+
+            if matrix is not None and len(matrix) > UPLOAD_BATCH_SIZE:
+                # Large ingest: hand the array to qdrant-client, which chunks it
+                # into UPLOAD_BATCH_SIZE requests and, over gRPC, sends each
+                # vector as packed float32 instead of JSON text. Uploads stay
+                # in-process (parallel=1): worker processes would be forked
+                # from callers that may already be running threads.
+                client.upload_collection(
+                    collection_name=self.config.collection_name,
+                    vectors=matrix,
+                    payload=payload_list,
+                    ids=list(ids),
+                    batch_size=UPLOAD_BATCH_SIZE,
+                    wait=wait,
                 )
+                return True
 
+            vector_rows = matrix.tolist() if matrix is not None else _vector_rows(vectors)
+
+            # Ship the batch column-wise: one Batch model instead of a validated
+            # PointStruct per point, with all vectors converted in a single pass.
+            batch = qdrant_models.Batch(
+                ids=list(ids),
+                vectors=vector_rows,
+                payloads=payload_list,
+            )
             client.upsert(
                 collection_name=self.config.collection_name,
-                points=points,
+                points=batch,
+                wait=wait,
             )
             return True
 
-        except Exception as e:
-            print(f"Failed to upsert vectors: {e}")
+        except Exception:
+            logger.exception("Failed to upsert vectors")
             return False
 
     def search(
         self,
-        query_vector: "Sequence[float]",
+        query_vector: "Sequence[float] | np.ndarray",
         limit: int = 10,
         score_threshold: float | None = None,
     ) -> list[VectorSearchResult]:
-        """Search for similar vectors."""
+        """Search for similar vectors.
+
+        ``query_vector`` is handed to qdrant-client as a float32 array, which
+        it accepts natively, instead of being boxed into a list of floats.
+        """
         client = self._get_client()
         if client is None:
             return []
@@ -313,25 +639,127 @@ class QdrantClientManager:
         try:
             results = client.search(
                 collection_name=self.config.collection_name,
-                query_vector=list(query_vector),
+                query_vector=_query_array(query_vector),
                 limit=limit,
                 score_threshold=score_threshold,
+                search_params=self._search_params,
             )
 
-            return [
-                VectorSearchResult(
-                    id=str(r.id),
-                    score=r.score,
-                    payload=r.payload or {},
-                    vector=r.vector,
+            return _to_results(results, self._quantize_upload)
+
+        except Exception:
+            logger.exception("Search failed")
+            return []
+
+    def search_batch(
+        self,
+        query_vectors: "Sequence[Sequence[float]] | np.ndarray",
+        limit: int = 10,
+        score_threshold: float | None = None,
+    ) -> list[list[VectorSearchResult]]:
+        """Run several searches in one request.
+
+        Qdrant evaluates the queries together, so K fan-out queries cost one
+        round-trip instead of K. Results are returned in query order.
+        """
+        client = self._get_client()
+        if client is None:
+            return []
+
+        try:
+            search_request = self._models.SearchRequest
+            requests = [
+                search_request(
+                    vector=vector,
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    with_payload=True,
+                    params=self._search_params,
                 )
-                for r in results
+                for vector in _vector_rows(query_vectors)
             ]
+            batches = client.search_batch(
+                collection_name=self.config.collection_name,
+                requests=requests,
+            )
+
+            return [_to_results(results, self._quantize_upload) for results in batches]
 
-        except Exception as e:
-            print(f"Search failed: {e}")
+        except Exception:
+            logger.exception("Batch search failed")
             return []
 
+    def search_bulk(
+        self,
+        query_vector: "Sequence[float] | np.ndarray",
+        limit: int = 10,
+        score_threshold: float | None = None,
+        *,
+        return_payload: bool = True,
+        rescore: bool = True,
+    ) -> SearchBatch:
+        """Search for similar vectors, returning columns rather than objects.
+
+        Meant for large result sets such as rerank candidates: no per-hit
+        result object is built, and with ``return_payload=False`` payloads
+        are neither transferred nor materialized. ``rescore=False`` ranks by
+        the quantized vectors alone, leaving exact scoring to the caller.
+        """
+        empty = SearchBatch(ids=[], scores=[], payloads=[] if return_payload else None)
+        client = self._get_client()
+        if client is None:
+            return empty
+
+        try:
+            results = client.search(
+                collection_name=self.config.collection_name,
+                query_vector=_query_array(query_vector),
+                limit=limit,
+                score_threshold=score_threshold,
+                search_params=self._search_params if rescore else self._scan_params,
+                with_payload=return_payload,
+            )
+        except Exception:
+            logger.exception("Search failed")
+            return empty
+
+        ids = [str(r.id) for r in results]
+        scores: np.ndarray | list[float] = [r.score for r in results]
+        if np is not None:
+            scores = np.fromiter(scores, dtype=np.float32, count=len(ids))
+        payloads = None
+        if return_payload:
+            if self._quantize_upload:
+                payloads = [_strip_scale(r.payload) for r in results]
+            else:
+                payloads = [r.payload or {} for r in results]
+        return SearchBatch(ids=ids, scores=scores, payloads=payloads)
+
+    def retrieve_vectors(self, ids: "Sequence[str]") -> dict[str, Any]:
+        """Fetch the stored vectors for ``ids``, keyed by point ID.
+
+        Vectors come back as float32 arrays when NumPy is available. Missing
+        points are left out of the result.
+        """
+        client = self._get_client()
+        if client is None:
+            return {}
+
+        try:
+            points = client.retrieve(
+                collection_name=self.config.collection_name,
+                ids=list(ids),
+                with_payload=False,
+                with_vectors=True,
+            )
+        except Exception:
+            logger.exception("Retrieve failed")
+            return {}
+
+        if np is None:
+            return {str(p.id): p.vector for p in points}
+        return {str(p.id): np.asarray(p.vector, dtype=np.float32) for p in points}
+
     def delete_vectors(self, ids: "Sequence[str]") -> bool:
         """Delete vectors by ID."""
         client = self._get_client()
@@ -339,7 +767,7 @@ class QdrantClientManager:
             return False
 
         try:
-            qdrant_models: Any = importlib.import_module("qdrant_client.models")
+            qdrant_models = self._models
 
             client.delete(
                 collection_name=self.config.collection_name,
@@ -347,8 +775,8 @@ class QdrantClientManager:
             )
             return True
 
-        except Exception as e:
-            print(f"Delete failed: {e}")
+        except Exception:
+            logger.exception("Delete failed")
             return False
 
     def get_collection_info(self) -> dict[str, Any] | None:
@@ -359,15 +787,45 @@ class QdrantClientManager:
 
         try:
             info = client.get_collection(self.config.collection_name)
-            return {
-                "name": info.config.params.vectors.size if hasattr(info.config.params, 'vectors') else 0,
-                "points_count": info.points_count,
-                "indexed_vectors_count": info.indexed_vectors_count,
-                "status": str(info.status),
-                "optimizer_status": str(info.optimizer_status),
-            }
         except Exception:
             return None
+        return self._collection_info(info)
+
+    async def get_collection_info_async(self) -> dict[str, Any] | None:
+        """Async variant of :meth:`get_collection_info`."""
+        client = self._get_async_client()
+        if client is None:
+            return None
+
+        try:
+            info = await client.get_collection(self.config.collection_name)
+        except Exception:
+            return None
+        return self._collection_info(info)
+
+    async def close_async(self) -> None:
+        """Close the async client; it is bound to the running event loop."""
+        client, self._aclient = self._aclient, None
+        if client is not None:
+            await client.close()
+
+    def _collection_info(self, info: Any) -> dict[str, Any]:
+        """Merge the cached schema with the live counters from ``info``."""
+        # The schema is fixed once the collection exists; only read it from the
+        # response the first time and serve the cached copy afterwards.
+        schema = self._schema
+        if schema is None:
+            try:
+                size = info.config.params.vectors.size
+            except AttributeError:  # Named vectors have no single size
+                size = 0
+            schema = self._schema = {"name": self.config.collection_name, "vector_size": size}
+        return schema | {
+            "points_count": info.points_count,
+            "indexed_vectors_count": info.indexed_vectors_count,
+            "status": str(info.status),
+            "optimizer_status": str(info.optimizer_status),
+        }
 
 
 # ============================================================================
@@ -397,21 +855,49 @@ class VectorCache:
         super().__init__()
         self.redis = RedisClientManager(redis_config)
         self.qdrant = QdrantClientManager(qdrant_config)
+        # Runs Redis calls alongside Qdrant ones; threads start on first use
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="vector-cache")
+        # Last Redis ping result and when it was taken (monotonic seconds)
+        self._ping_ok = False
+        self._ping_checked_at = float("-inf")
+        # LRU of float32 vectors for search_rerank, most recently used last
+        self._hot_vectors: OrderedDict[str, Any] = OrderedDict()
+        self._hot_lock = threading.Lock()
 
     def initialize(self) -> bool:
-        """Initialize both backends."""
-        redis_ok = self.redis.ping()
-        qdrant_ok = self.qdrant.ensure_collection()
+        """Initialize both backends.
 
+        The Redis ping runs alongside the Qdrant collection check, so cold
+        start costs the slower of the two rather than their sum.
+        """
+        redis_future = self._executor.submit(self._ping_redis)
+        qdrant_ok = self.qdrant.ensure_collection()
+        return self._report_backends(redis_future.result(), qdrant_ok)
+
+    async def initialize_async(self) -> bool:
+        """Initialize both backends on the running event loop.
+
+        Uses ``redis.asyncio`` and ``AsyncQdrantClient``, awaiting the Redis
+        ping and the collection check together.
+        """
+        redis_ok, qdrant_ok = await asyncio.gather(
+            self.redis.ping_async(), self.qdrant.ensure_collection_async()
+        )
+        self._record_ping(redis_ok)
+        return self._report_backends(redis_ok, qdrant_ok)
+
+    @staticmethod
+    def _report_backends(redis_ok: bool, qdrant_ok: bool) -> bool:
+        """Log the state of each backend and return whether both are up."""
         if redis_ok:
-            print("✓ Redis connected")
+            logger.info("✓ Redis connected")
         else:
-            print("✗ Redis not available")
+            logger.warning("✗ Redis not available")
 
         if qdrant_ok:
-            print("✓ Qdrant collection ready")
+            logger.info("✓ Qdrant collection ready")
         else:
-            print("✗ Qdrant not available")
+            logger.warning("✗ Qdrant not available")
 
         return redis_ok and qdrant_ok
 
@@ -422,17 +908,55 @@ class VectorCache:
         metadata: dict[str, Any] | None = None,
         ttl: int | None = None,
     ) -> bool:
-        """Store vector with metadata."""
+        """Store vector with metadata.
+
+        The Redis write and the Qdrant upsert are independent, so they run
+        concurrently; the call succeeds only if both backends accepted it.
+        """
         # Store metadata in Redis
-        import json
-        meta_key = f"vec:meta:{key}"
-        meta_value = json.dumps(metadata or {})
-        self.redis.set(meta_key, meta_value, ex=ttl)
+        meta_key = f"{META_KEY_PREFIX}{key}"
+        meta_value = _dumps(metadata or {})
+        redis_future = self._executor.submit(self.redis.set, meta_key, meta_value, ttl)
 
         # Store vector in Qdrant
         payload = metadata.copy() if metadata else {}
         payload["_key"] = key
-        return self.qdrant.upsert_vectors([key], [list(vector)], [payload])
+        self._forget_hot([key])
+        qdrant_ok = self.qdrant.upsert_vectors([key], [vector], [payload])
+        return bool(redis_future.result()) and qdrant_ok
+
+    def store_many(
+        self,
+        items: "Sequence[tuple[str, Sequence[float], dict[str, Any] | None]]",
+        ttl: int | None = None,
+        *,
+        wait: bool = False,
+    ) -> bool:
+        """Store a batch of ``(key, vector, metadata)`` entries.
+
+        All metadata goes to Redis in one pipelined round-trip and all vectors
+        to Qdrant in one upsert, instead of two requests per entry. Bulk ingest
+        does not wait for Qdrant to apply the points unless ``wait`` is set.
+        """
+        if not items:
+            return True
+
+        mapping: dict[str, str | bytes] = {}
+        keys: list[str] = []
+        vectors: list[Sequence[float]] = []
+        payloads: list[dict[str, Any]] = []
+        for key, vector, metadata in items:
+            mapping[f"{META_KEY_PREFIX}{key}"] = _dumps(metadata or {})
+            keys.append(key)
+            vectors.append(vector)
+            payload = metadata.copy() if metadata else {}
+            payload["_key"] = key
+            payloads.append(payload)
+
+        redis_future = self._executor.submit(self.redis.set_many, mapping, ttl)
+        self._forget_hot(keys)
+        qdrant_ok = self.qdrant.upsert_vectors(keys, vectors, payloads, wait=wait)
+        return redis_future.result() and qdrant_ok
 
     def search_similar(
         self,
@@ -442,48 +966,181 @@ class VectorCache:
         """Search for similar vectors."""
         return self.qdrant.search(query_vector, limit=limit)
 
+    def search_similar_batch(
+        self,
+        query_vectors: "Sequence[Sequence[float]] | np.ndarray",
+        limit: int = 10,
+    ) -> list[list[VectorSearchResult]]:
+        """Search for vectors similar to each query in one round-trip."""
+        return self.qdrant.search_batch(query_vectors, limit=limit)
+
+    def search_rerank(
+        self,
+        query_vector: "Sequence[float] | np.ndarray",
+        limit: int = 10,
+        oversample: int = 4,
+    ) -> list[VectorSearchResult]:
+        """Search the quantized index, then rescore the candidates locally.
+
+        Fetches ``limit * oversample`` candidates ranked by the INT8 vectors
+        alone, so Qdrant never reads the on-disk float32 originals, and
+        rescores them against float32 copies held in an in-process LRU of
+        ``RERANK_CACHE_SIZE`` vectors. Cache misses are filled with a single
+        retrieve. Falls back to :meth:`search_similar` without NumPy or for
+        metrics other than cosine and dot product. Under
+        ``client_quantization`` the stored copies are the INT8 grid, so the
+        rescore is only as exact as that grid.
+        """
+        metric = self.qdrant.config.distance_metric
+        if np is None or metric == VectorDistanceMetric.EUCLIDEAN:
+            return self.search_similar(query_vector, limit)
+
+        candidates = self.qdrant.search_bulk(
+            query_vector, limit=limit * oversample, rescore=False
+        )
+        if not candidates.ids:
+            return []
+        matrix = self._hot_matrix(candidates.ids)
+        if matrix is None:
+            return self.search_similar(query_vector, limit)
+
+        query = _query_array(query_vector)
+        if metric == VectorDistanceMetric.COSINE:
+            # Qdrant stores cosine vectors normalized; match that on the query
+            query = query / (np.linalg.norm(query) or 1.0)
+        # One matrix-vector product (BLAS sgemv) scores every candidate
+        scores = matrix @ query
+        top = np.argsort(-scores, kind="stable")[:limit]
+
+        result = VectorSearchResult
+        ids = candidates.ids
+        payloads = candidates.payloads or []
+        return [result(ids[i], float(scores[i]), payloads[i], None) for i in top.tolist()]
+
+    def _hot_matrix(self, ids: "Sequence[str]") -> "np.ndarray | None":
+        """Stack the float32 vectors for ``ids``, fetching LRU misses.
+
+        Returns ``None`` if any vector could not be retrieved.
+        """
+        hot = self._hot_vectors
+        with self._hot_lock:
+            rows = [hot.get(point_id) for point_id in ids]
+            for point_id, row in zip(ids, rows):
+                if row is not None:
+                    hot.move_to_end(point_id)
+
+        missing = [point_id for point_id, row in zip(ids, rows) if row is None]
+        if missing:
+            fetched = self.qdrant.retrieve_vectors(missing)
+            if len(fetched) < len(missing):
+                return None
+            with self._hot_lock:
+                hot.update(fetched)
+                while len(hot) > RERANK_CACHE_SIZE:
+                    hot.popitem(last=False)
+            rows = [
+                fetched[point_id] if row is None else row
+                for point_id, row in zip(ids, rows)
+            ]
+
+        return np.stack(rows)
+
+    def _forget_hot(self, keys: "Iterable[str]") -> None:
+        """Drop cached rerank vectors for keys that are being rewritten."""
+        with self._hot_lock:
+            for key in keys:
+                self._hot_vectors.pop(key, None)
+
     def get_metadata(self, key: str) -> dict[str, Any] | None:
         """Get metadata from Redis."""
-        import json
-        meta_key = f"vec:meta:{key}"
+        meta_key = f"{META_KEY_PREFIX}{key}"
         value = self.redis.get(meta_key)
         if value:
-            return json.loads(value)
+            return _loads(value)
         return None
 
     def delete(self, key: str) -> bool:
         """Delete from both backends."""
-        self.redis.delete(f"vec:meta:{key}")
+        self.redis.delete(f"{META_KEY_PREFIX}{key}")
+        self._forget_hot([key])
         return self.qdrant.delete_vectors([key])
 
     def stats(self) -> dict[str, Any]:
-        """Get cache statistics."""
+        """Get cache statistics.
+
+        Redis liveness is cached for ``PING_CACHE_TTL`` seconds, so frequent
+        polling does not cost a ping round-trip per call.
+        """
+        if time.monotonic() - self._ping_checked_at < PING_CACHE_TTL:
+            return {
+                "redis_connected": self._ping_ok,
+                "qdrant_collection": self.qdrant.get_collection_info(),
+            }
+        redis_future = self._executor.submit(self._ping_redis)
         qdrant_info = self.qdrant.get_collection_info()
         return {
-            "redis_connected": self.redis.ping(),
+            "redis_connected": redis_future.result(),
+            "qdrant_collection": qdrant_info,
+        }
+
+    async def stats_async(self) -> dict[str, Any]:
+        """Async variant of :meth:`stats`, sharing its ping cache."""
+        if time.monotonic() - self._ping_checked_at < PING_CACHE_TTL:
+            return {
+                "redis_connected": self._ping_ok,
+                "qdrant_collection": await self.qdrant.get_collection_info_async(),
+            }
+        redis_ok, qdrant_info = await asyncio.gather(
+            self.redis.ping_async(), self.qdrant.get_collection_info_async()
+        )
+        self._record_ping(redis_ok)
+        return {
+            "redis_connected": redis_ok,
             "qdrant_collection": qdrant_info,
         }
 
+    async def close_async(self) -> None:
+        """Close the async clients before their event loop shuts down."""
+        await asyncio.gather(self.redis.close_async(), self.qdrant.close_async())
+
+    def _ping_redis(self) -> bool:
+        """Ping Redis and remember the result for ``stats``."""
+        return self._record_ping(self.redis.ping())
+
+    def _record_ping(self, ok: bool) -> bool:
+        """Remember a Redis ping result for ``stats``."""
+        self._ping_ok = ok
+        self._ping_checked_at = time.monotonic()
+        return ok
+
 
 # ============================================================================
 # Main Entry Point
 # ============================================================================
 
 
-def main() -> int:
+async def amain() -> int:
     """Test vector cache connectivity."""
     print("=== Vector Cache Status ===\n")
 
     cache = VectorCache()
+    try:
+        if await cache.initialize_async():
+            print("\nVector cache initialized successfully!")
+            stats = await cache.stats_async()
+            print(f"\nStats: {stats}")
+            return 0
+        else:
+            print("\nVector cache initialization failed.")
+            return 1
+    finally:
+        await cache.close_async()
 
-    if cache.initialize():
-        print("\nVector cache initialized successfully!")
-        stats = cache.stats()
-        print(f"\nStats: {stats}")
-        return 0
-    else:
-        print("\nVector cache initialization failed.")
-        return 1
+
+def main() -> int:
+    """Run the connectivity check on an event loop."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    return asyncio.run(amain())
 
 
 if __name__ == "__main__":
@@ -598,6 +598,35 @@ class PipelineProtocol(Protocol):
     Batches multiple commands for efficient execution.
     """
 
+    def set(
+        self,
+        name: str,
+        value: Any,
+        ex: int | None = None,
+    ) -> "PipelineProtocol":
+        """Queue a SET command.
+
+        Args:
+            name: Key name
+            value: Value to set
+            ex: Expiry in seconds
+
+        Returns:
+            The pipeline, for chaining
+        """
+        ...
+
+    def mset(self, mapping: dict[str, Any]) -> "PipelineProtocol":
+        """Queue an MSET command setting several keys at once.
+
+        Args:
+            mapping: Key/value pairs to set
+
+        Returns:
+            The pipeline, for chaining
+        """
+        ...
+
     def execute(
         self,
         raise_on_error: bool = True,
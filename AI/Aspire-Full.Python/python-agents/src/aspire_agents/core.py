@@ -18,10 +18,12 @@ Thread Safety:
 
 from __future__ import annotations
 
+import asyncio
 import functools
 import inspect
 import logging
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Final, ParamSpec, TypeVar, cast
 
 from agents import Agent as OpenAIAgent
@@ -56,23 +58,15 @@ __all__: Final[list[str]] = [
 ]
 
 
+@dataclass(frozen=True, slots=True)
 class _ToolContext:
     """Immutable context for guardrail evaluation.
 
-    Thread-safe via __slots__ and immutable design.
+    Defined once at module scope; thread-safe via slots and frozen fields.
     """
 
-    __slots__ = ("tool_name", "tool_arguments")
-
-    def __init__(
-        self,
-        name: str,
-        args: tuple[Any, ...],
-        kwargs: dict[str, Any],
-    ) -> None:
-        super().__init__()
-        self.tool_name: str = name
-        self.tool_arguments: dict[str, Any] | tuple[Any, ...] = kwargs if kwargs else args
+    tool_name: str
+    tool_arguments: dict[str, Any] | tuple[Any, ...]
 
 
 def function_tool(func: F) -> F:
@@ -101,53 +95,100 @@ def function_tool(func: F) -> F:
         The decorated function with guardrail support
     """
 
-    @functools.wraps(func)
-    async def wrapper(*args: Any, **kwargs: Any) -> Any:
-        context = _ToolContext(func.__name__, args, kwargs)
+    # Guardrail lists live in the closure; the same objects are exposed as
+    # attributes below so callers can still append to them. Guardrail
+    # contexts are only built when a list is non-empty, so the default
+    # zero-guardrail call allocates nothing extra.
+    input_guardrails: list[Any] = []
+    output_guardrails: list[Any] = []
+    tool_name = func.__name__
 
-        # 1. Input Guardrails - block harmful input before execution
-        input_guardrails: list[Any] = getattr(wrapper, "tool_input_guardrails", [])
-        if input_guardrails:
-            input_data = ToolInputGuardrailData(context=context)
-            for guardrail in input_guardrails:
-                try:
-                    result = await guardrail(input_data)
-                    if result.message:
-                        logger.warning(
-                            "Input guardrail blocked call to %s: %s",
-                            func.__name__,
-                            result.message,
-                        )
-                        return result.message
-                except Exception as e:
-                    logger.error("Error in input guardrail for %s: %s", func.__name__, e)
-                    raise
+    async def check_input(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        """Return a blocking guardrail message, or None to proceed.
 
-        # 2. Execute Tool
+        Guardrails are independent, so they run concurrently; the first one
+        to report a message blocks the call and the rest are cancelled.
+        """
+        context = _ToolContext(tool_name, kwargs or args)
+        input_data = ToolInputGuardrailData(context=context)
+        tasks = [asyncio.ensure_future(guardrail(input_data)) for guardrail in input_guardrails]
         try:
-            if inspect.iscoroutinefunction(func):
-                result = await func(*args, **kwargs)
-            else:
-                result = func(*args, **kwargs)
-        except Exception:
-            raise
-
-        # 3. Output Guardrails - detect PII/sensitive data in output
-        output_guardrails: list[Any] = getattr(wrapper, "tool_output_guardrails", [])
-        if output_guardrails:
-            output_data = ToolOutputGuardrailData(output=result, context=context)
-            for guardrail in output_guardrails:
+            for next_done in asyncio.as_completed(tasks):
                 try:
-                    await guardrail(output_data)
+                    result = await next_done
                 except Exception as e:
-                    logger.error("Output guardrail triggered for %s: %s", func.__name__, e)
+                    logger.error("Error in input guardrail for %s: %s", tool_name, e)
                     raise
-
-        return result
-
-    # Initialize guardrail lists as mutable attributes
-    wrapper.tool_input_guardrails = []  # type: ignore[attr-defined]
-    wrapper.tool_output_guardrails = []  # type: ignore[attr-defined]
+                if result.message:
+                    logger.warning(
+                        "Input guardrail blocked call to %s: %s",
+                        tool_name,
+                        result.message,
+                    )
+                    return result.message
+        finally:
+            for task in tasks:
+                task.cancel()
+        return None
+
+    async def check_output(
+        result: Any, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> None:
+        """Run output guardrails concurrently, re-raising the first failure."""
+        context = _ToolContext(tool_name, kwargs or args)
+        output_data = ToolOutputGuardrailData(output=result, context=context)
+        outcomes = await asyncio.gather(
+            *(guardrail(output_data) for guardrail in output_guardrails),
+            return_exceptions=True,
+        )
+        # BaseException too: a guardrail ending in CancelledError (or any
+        # non-Exception) has not passed, so the output must not go through.
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                logger.error("Output guardrail triggered for %s: %s", tool_name, outcome)
+                raise outcome
+
+    # Specialize at decoration time so the sync/async branch is not
+    # re-evaluated on every call.
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # 1. Input Guardrails - block harmful input before execution
+            if input_guardrails:
+                blocked = await check_input(args, kwargs)
+                if blocked is not None:
+                    return blocked
+
+            # 2. Execute Tool
+            result = await func(*args, **kwargs)
+
+            # 3. Output Guardrails - detect PII/sensitive data in output
+            if output_guardrails:
+                await check_output(result, args, kwargs)
+            return result
+
+    else:
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # 1. Input Guardrails - block harmful input before execution
+            if input_guardrails:
+                blocked = await check_input(args, kwargs)
+                if blocked is not None:
+                    return blocked
+
+            # 2. Execute Tool
+            result = func(*args, **kwargs)
+
+            # 3. Output Guardrails - detect PII/sensitive data in output
+            if output_guardrails:
+                await check_output(result, args, kwargs)
+            return result
+
+    # Expose the closure's guardrail lists as mutable attributes
+    wrapper.tool_input_guardrails = input_guardrails  # type: ignore[attr-defined]
+    wrapper.tool_output_guardrails = output_guardrails  # type: ignore[attr-defined]
 
     # Apply the original OpenAI function_tool decorator
     return cast(F, _original_function_tool(wrapper))
@@ -3,6 +3,7 @@ This module defines the main entry point for the research bot.
 """
 
 import asyncio
+import signal
 
 from aspire_agents.gpu import ensure_tensor_core_gpu
 
@@ -13,8 +14,23 @@ async def main() -> None:
     """
     Main entry point for the research bot.
     """
-    ensure_tensor_core_gpu()
-    query = input("What would you like to research? ")
+    # Warm the GPU while the user is typing instead of before the prompt
+    gpu_ready = asyncio.create_task(asyncio.to_thread(ensure_tensor_core_gpu))
+    await asyncio.sleep(0)  # Start the warm-up thread before input() blocks the loop
+
+    # input() stays on the main thread so Ctrl-C interrupts it; asyncio.run's
+    # SIGINT handler would only cancel this task at an await that never comes.
+    previous_handler = signal.signal(signal.SIGINT, signal.default_int_handler)
+    try:
+        query = input("What would you like to research? ")
+    except BaseException:
+        # Collect the warm-up so its outcome is not reported as never retrieved
+        gpu_ready.cancel()
+        await asyncio.gather(gpu_ready, return_exceptions=True)
+        raise
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+    await gpu_ready
     await ResearchManager().run(query)
 
 
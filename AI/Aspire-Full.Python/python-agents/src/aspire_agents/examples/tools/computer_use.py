@@ -4,7 +4,9 @@ This module demonstrates the usage of the ComputerTool with a local Playwright b
 
 import asyncio
 import base64
-from typing import TYPE_CHECKING, Any, Literal, cast
+import functools
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, cast
 
 from agents import (
     Agent,
@@ -27,9 +29,23 @@ except ImportError:
 
 if TYPE_CHECKING:
 
+    class CDPSession:
+        """CDPSession stub."""
+
+        async def send(self, method: str, params: dict[str, Any] | None = None) -> Any:
+            _ = (method, params)
+            return None
+
     class Page:
         """Page stub."""
 
+        class Context:
+            """BrowserContext stub."""
+
+            async def new_cdp_session(self, page: Any) -> CDPSession:
+                _ = page
+                return cast(Any, None)
+
         class Mouse:
             """Mouse stub."""
 
@@ -60,8 +76,12 @@ if TYPE_CHECKING:
             async def up(self, key: str) -> None:
                 _ = key
 
+            async def press(self, key: str) -> None:
+                _ = key
+
         mouse: Mouse
         keyboard: Keyboard
+        context: Context
 
         async def set_viewport_size(self, size: dict[str, int]) -> None:
             _ = size
@@ -69,14 +89,22 @@ if TYPE_CHECKING:
         async def goto(self, url: str) -> None:
             _ = url
 
-        async def screenshot(self, full_page: bool = True) -> bytes:
-            _ = full_page
+        async def screenshot(
+            self,
+            full_page: bool = True,
+            type: str = "png",
+            quality: int | None = None,
+        ) -> bytes:
+            _ = (full_page, type, quality)
             return b""
 
         async def evaluate(self, script: str) -> Any:
             _ = script
             return None
 
+        async def close(self) -> None:
+            pass
+
     class Browser:
         """Browser stub."""
 
@@ -111,14 +139,22 @@ if TYPE_CHECKING:
         return cast(Any, None)
 
 else:
+    # Playwright is imported on first use (see _load_async_playwright) so
+    # importing this module does not pull in the driver.
+    Browser = Any
+    CDPSession = Any
+    Page = Any
+    Playwright = Any
+
+
+@functools.cache
+def _load_async_playwright() -> Any:
+    """Import Playwright's async entry point, or return None if not installed."""
     try:
-        from playwright.async_api import Browser, Page, Playwright, async_playwright
+        from playwright.async_api import async_playwright as factory
     except ImportError:
-        # For type checking or if playwright is not installed
-        Browser = Any
-        Page = Any
-        Playwright = Any
-        async_playwright = None
+        return None
+    return factory
 
 # Uncomment to see very verbose logs
 # import logging
@@ -145,7 +181,7 @@ async def main() -> None:
             print(result.final_output)
 
 
-CUA_KEY_TO_PLAYWRIGHT_KEY = {
+CUA_KEY_TO_PLAYWRIGHT_KEY = MappingProxyType({
     "/": "Divide",
     "\\": "Backslash",
     "alt": "Alt",
@@ -171,47 +207,104 @@ CUA_KEY_TO_PLAYWRIGHT_KEY = {
     "super": "Meta",
     "tab": "Tab",
     "win": "Meta",
-}
+})
+_KEY_GET = CUA_KEY_TO_PLAYWRIGHT_KEY.get
 
 
 class LocalPlaywrightComputer(AsyncComputer):
-    """A computer, implemented using a local Playwright browser."""
+    """A computer, implemented using a local Playwright browser.
+
+    Chromium is shared by every session in the interpreter: each session
+    opens its own page, and the last one to exit closes the browser.
+    """
+
+    _shared_playwright: ClassVar[Playwright | None] = None
+    _shared_browser: ClassVar[Browser | None] = None
+    _shared_refcount: ClassVar[int] = 0
+    _shared_lock: ClassVar[asyncio.Lock | None] = None
+    _shared_lock_loop: ClassVar[asyncio.AbstractEventLoop | None] = None
 
     def __init__(self) -> None:
         self._playwright: Playwright | None = None
         self._browser: Browser | None = None
         self._page: Page | None = None
+        self._cdp: CDPSession | None = None
 
     async def _get_browser_and_page(self) -> tuple[Browser, Page]:
         """
-        Launch the browser and create a new page.
+        Acquire the shared browser (launching it if needed) and open a new page.
         """
+        cls = type(self)
         width, height = self.dimensions
-        launch_args = [f"--window-size={width},{height}"]
-        browser = await self.playwright.chromium.launch(headless=False, args=launch_args)
-        page = await browser.new_page()
-        await page.set_viewport_size({"width": width, "height": height})
-        await page.goto("https://www.bing.com")
+        loop = asyncio.get_running_loop()
+        if cls._shared_lock is None or cls._shared_lock_loop is not loop:
+            # One lock per event loop, created inside the loop that uses it
+            cls._shared_lock = asyncio.Lock()
+            cls._shared_lock_loop = loop
+        async with cls._shared_lock:
+            if cls._shared_browser is None:
+                cls._shared_playwright = await _load_async_playwright()().start()
+                launch_args = [f"--window-size={width},{height}"]
+                cls._shared_browser = await cls._shared_playwright.chromium.launch(
+                    headless=False, args=launch_args
+                )
+            cls._shared_refcount += 1
+            browser = cls._shared_browser
+        page: Page | None = None
+        try:
+            page = await browser.new_page()
+            await page.set_viewport_size({"width": width, "height": height})
+            await page.goto("https://www.bing.com")
+        except BaseException:
+            # Give the reference back, or the browser outlives every session
+            if page is not None:
+                await page.close()
+            await self._release_browser(browser)
+            raise
         return browser, page
 
+    async def _release_browser(self, browser: Browser) -> None:
+        """
+        Drop this session's reference, closing the browser after the last one.
+        """
+        cls = type(self)
+        assert cls._shared_lock is not None
+        async with cls._shared_lock:
+            cls._shared_refcount -= 1
+            if cls._shared_refcount == 0:
+                await browser.close()
+                if cls._shared_playwright:
+                    await cls._shared_playwright.stop()
+                cls._shared_browser = None
+                cls._shared_playwright = None
+
     async def __aenter__(self) -> "LocalPlaywrightComputer":
         """
         Start the computer session.
         """
-        # Start Playwright and call the subclass hook for getting browser/page
-        if cast(Any, async_playwright) is not None:
-            self._playwright = await async_playwright().start()
+        # Acquire the shared browser and call the subclass hook for the page
+        if _load_async_playwright() is not None:
             self._browser, self._page = await self._get_browser_and_page()
+            self._playwright = type(self)._shared_playwright
+            # Raw CDP session for pipelining input events without awaiting each
+            try:
+                self._cdp = await self._page.context.new_cdp_session(self._page)
+            except BaseException:
+                await self.__aexit__(None, None, None)
+                raise
         return self
 
     async def __aexit__(self, _exc_type: Any, _exc_val: Any, _exc_tb: Any) -> None:
         """
-        End the computer session.
+        End the computer session, closing the browser if no session remains.
         """
-        if self._browser:
-            await self._browser.close()
-        if self._playwright:
-            await self._playwright.stop()
+        if self._page:
+            await self._page.close()
+            self._page = None
+        if self._browser is None:
+            return
+        browser, self._browser = self._browser, None
+        await self._release_browser(browser)
 
     @property
     def playwright(self) -> Playwright:
@@ -236,10 +329,19 @@ class LocalPlaywrightComputer(AsyncComputer):
     def dimensions(self) -> tuple[int, int]:
         return (1024, 768)
 
-    async def screenshot(self) -> str:
-        """Capture only the viewport (not full_page)."""
-        png_bytes = await self.page.screenshot(full_page=False)
-        return base64.b64encode(png_bytes).decode("utf-8")
+    async def screenshot(self, *, fmt: Literal["png", "jpeg"] = "png") -> str:
+        """Capture only the viewport (not full_page).
+
+        The SDK labels the result as PNG, so that stays the default; pass
+        ``fmt="jpeg"`` for a several-times smaller capture when the consumer
+        does not need lossless output.
+        """
+        if fmt == "jpeg":
+            image_bytes = await self.page.screenshot(full_page=False, type="jpeg", quality=80)
+        else:
+            image_bytes = await self.page.screenshot(full_page=False)
+        # base64 output is pure ASCII, which decodes faster than UTF-8
+        return base64.b64encode(image_bytes).decode("ascii")
 
     async def click(self, x: int, y: int, button: Button = "left") -> None:
         """
@@ -263,8 +365,12 @@ class LocalPlaywrightComputer(AsyncComputer):
         """
         Scroll the page.
         """
-        await self.page.mouse.move(x, y)
-        await self.page.evaluate(f"window.scrollBy({scroll_x}, {scroll_y})")
+        # window.scrollBy does not depend on the pointer, so issue both
+        # calls together: one round-trip of latency instead of two.
+        await asyncio.gather(
+            self.page.mouse.move(x, y),
+            self.page.evaluate(f"window.scrollBy({scroll_x}, {scroll_y})"),
+        )
 
     async def type(self, text: str) -> None:
         """
@@ -288,7 +394,15 @@ class LocalPlaywrightComputer(AsyncComputer):
         """
         Press a combination of keys.
         """
-        mapped_keys = [CUA_KEY_TO_PLAYWRIGHT_KEY.get(key.lower(), key) for key in keys]
+        # CUA usually sends lowercase names, so try the raw key first and only
+        # lowercase on a miss; bind the lookup locally for the comprehension.
+        get = _KEY_GET
+        mapped_keys = [get(key) or get(key.lower(), key) for key in keys]
+        if mapped_keys and not any("+" in key for key in mapped_keys):
+            # Playwright parses "Control+Shift+T" as a chord and sends the
+            # whole down/up sequence in one call instead of 2N round-trips.
+            await self.page.keyboard.press("+".join(mapped_keys))
+            return
         for key in mapped_keys:
             await self.page.keyboard.down(key)
         for key in reversed(mapped_keys):
@@ -302,8 +416,23 @@ class LocalPlaywrightComputer(AsyncComputer):
             return
         await self.page.mouse.move(path[0][0], path[0][1])
         await self.page.mouse.down()
-        for px, py in path[1:]:
-            await self.page.mouse.move(px, py)
+        if self._cdp is not None and len(path) > 2:
+            # Pipeline the intermediate moves over the CDP websocket: one
+            # round-trip of latency instead of one per point.
+            await asyncio.gather(
+                *(
+                    self._cdp.send(
+                        "Input.dispatchMouseEvent",
+                        {"type": "mouseMoved", "x": px, "y": py, "button": "left", "buttons": 1},
+                    )
+                    for px, py in path[1:-1]
+                )
+            )
+            # Finish through Playwright so its tracked pointer position is current
+            await self.page.mouse.move(path[-1][0], path[-1][1])
+        else:
+            for px, py in path[1:]:
+                await self.page.mouse.move(px, py)
         await self.page.mouse.up()
 
 
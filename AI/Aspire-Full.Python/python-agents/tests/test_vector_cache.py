@@ -0,0 +1,197 @@
+"""Tests for scripts/vector_cache.py.
+
+Behavior tests for the batched and reranking vector cache paths:
+- store_many: pipelined Redis metadata (MSET, or SET EX per key with a TTL)
+- search_batch / search_bulk: multi-query and column-oriented search
+- search_rerank: client-side rescoring with the float32 LRU
+
+Backends run in-process: Qdrant in ``:memory:`` mode and fakeredis.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import uuid
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+np = pytest.importorskip("numpy")
+qdrant_client = pytest.importorskip("qdrant_client")
+fakeredis = pytest.importorskip("fakeredis")
+
+_SCRIPT_PATH = Path(__file__).parents[1] / "scripts" / "vector_cache.py"
+
+VECTOR_SIZE = 16
+POINT_COUNT = 200
+
+
+def _load_module() -> ModuleType:
+    """Import the script as a module (scripts/ is not a package)."""
+    spec = importlib.util.spec_from_file_location("vector_cache", _SCRIPT_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+vc = _load_module()
+
+
+def _key(i: int) -> str:
+    """Deterministic UUID point ID (Qdrant rejects arbitrary strings)."""
+    return str(uuid.uuid5(uuid.NAMESPACE_OID, str(i)))
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def cache() -> Any:
+    """VectorCache wired to in-memory Qdrant and fakeredis."""
+    cache = vc.VectorCache(qdrant_config=vc.QdrantConfig(vector_size=VECTOR_SIZE))
+    cache.qdrant._client = qdrant_client.QdrantClient(location=":memory:")
+    cache.redis._client = fakeredis.FakeRedis(decode_responses=True)
+    assert cache.initialize()
+    return cache
+
+
+@pytest.fixture
+def vectors() -> Any:
+    """Random float32 vectors, one row per point."""
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((POINT_COUNT, VECTOR_SIZE)).astype(np.float32)
+
+
+@pytest.fixture
+def filled(cache: Any, vectors: Any) -> Any:
+    """Cache holding every row of ``vectors`` under ``_key(i)``."""
+    items = [(_key(i), row, {"i": i}) for i, row in enumerate(vectors)]
+    assert cache.store_many(items, wait=True)
+    return cache
+
+
+def _exact_ranking(vectors: Any, query: Any) -> list[str]:
+    """Brute-force cosine ranking of every point."""
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = unit @ (query / np.linalg.norm(query))
+    return [_key(i) for i in np.argsort(-scores, kind="stable")]
+
+
+# ============================================================================
+# store_many Tests
+# ============================================================================
+
+
+class TestStoreMany:
+    """Tests for VectorCache.store_many."""
+
+    def test_empty_batch(self, cache: Any) -> None:
+        """Test an empty batch succeeds without touching either backend."""
+        assert cache.store_many([])
+        assert cache.redis._client.dbsize() == 0
+
+    def test_without_ttl(self, filled: Any) -> None:
+        """Test metadata is written without expiry and vectors are stored."""
+        redis = filled.redis._client
+        assert filled.get_metadata(_key(7)) == {"i": 7}
+        assert redis.ttl(f"{vc.META_KEY_PREFIX}{_key(7)}") == -1
+        assert redis.dbsize() == POINT_COUNT
+        info = filled.qdrant.get_collection_info()
+        assert info["points_count"] == POINT_COUNT
+
+    def test_with_ttl(self, cache: Any, vectors: Any) -> None:
+        """Test every key gets the expiry when a TTL is given."""
+        items = [(_key(i), vectors[i], {"i": i}) for i in range(3)]
+        assert cache.store_many(items, ttl=60, wait=True)
+
+        redis = cache.redis._client
+        for i in range(3):
+            ttl = redis.ttl(f"{vc.META_KEY_PREFIX}{_key(i)}")
+            assert 0 < ttl <= 60
+            assert cache.get_metadata(_key(i)) == {"i": i}
+
+
+# ============================================================================
+# Search Tests
+# ============================================================================
+
+
+class TestSearchBatch:
+    """Tests for batched and column-oriented search."""
+
+    def test_results_in_query_order(self, filled: Any, vectors: Any) -> None:
+        """Test each query's own point ranks first, in query order."""
+        batches = filled.search_similar_batch(vectors[:3], limit=2)
+
+        assert [results[0].id for results in batches] == [_key(0), _key(1), _key(2)]
+        assert all(len(results) == 2 for results in batches)
+
+    def test_bulk_columns(self, filled: Any, vectors: Any) -> None:
+        """Test search_bulk returns parallel ID, score and payload columns."""
+        batch = filled.qdrant.search_bulk(vectors[4], limit=5)
+
+        assert len(batch) == 5
+        assert batch.ids[0] == _key(4)
+        assert batch.scores.dtype == np.float32
+        assert batch.payloads[0]["i"] == 4
+
+    def test_bulk_without_payload(self, filled: Any, vectors: Any) -> None:
+        """Test return_payload=False leaves payloads out entirely."""
+        batch = filled.qdrant.search_bulk(vectors[4], limit=5, return_payload=False)
+
+        assert len(batch) == 5
+        assert batch.payloads is None
+
+
+# ============================================================================
+# search_rerank Tests
+# ============================================================================
+
+
+class TestSearchRerank:
+    """Tests for VectorCache.search_rerank and its float32 LRU."""
+
+    def test_matches_exact_ranking(self, filled: Any, vectors: Any) -> None:
+        """Test reranked hits follow the exact cosine ranking."""
+        query = np.random.default_rng(1).standard_normal(VECTOR_SIZE)
+
+        results = filled.search_rerank(query, limit=5)
+
+        assert [r.id for r in results] == _exact_ranking(vectors, query)[:5]
+        scores = [r.score for r in results]
+        assert scores == sorted(scores, reverse=True)
+        assert results[0].payload["_key"] == results[0].id
+
+    def test_fills_cache_with_candidates(self, filled: Any, vectors: Any) -> None:
+        """Test every oversampled candidate lands in the LRU."""
+        filled.search_rerank(vectors[0], limit=3, oversample=4)
+
+        assert len(filled._hot_vectors) == 12
+        assert _key(0) in filled._hot_vectors
+
+    def test_eviction_at_capacity(
+        self, filled: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the least recently used vector is evicted at RERANK_CACHE_SIZE."""
+        monkeypatch.setattr(vc, "RERANK_CACHE_SIZE", 3)
+        for i in (0, 1, 2, 0, 3):  # Re-reading 0 makes 1 the oldest entry
+            filled._hot_matrix([_key(i)])
+
+        assert list(filled._hot_vectors) == [_key(2), _key(0), _key(3)]
+
+    def test_store_and_delete_invalidate(self, filled: Any, vectors: Any) -> None:
+        """Test rewritten and deleted keys are dropped from the LRU."""
+        filled._hot_matrix([_key(0), _key(1)])
+
+        filled.store(_key(0), vectors[5])
+        filled.delete(_key(1))
+
+        assert _key(0) not in filled._hot_vectors
+        assert _key(1) not in filled._hot_vectors